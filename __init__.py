@@ -1,27 +1,73 @@
 # Make the src directory a package and expose core functions
+#
+# The functions below are imported on first use (module-level __getattr__),
+# so `from src import clean_data` only loads the modules cleaning needs and
+# not matplotlib, seaborn or scikit-learn.
 
-from .data_loading_and_exploration import load_data
-from .data_cleaning_and_preprocessing import clean_data, parse_dates
-from .data_feature_engineering import engineer_features
-from .save_transformed_data import save_data
-
-# Visualizations
-from .data_visualization import (
-    plot_pickup_point_distribution,
-    plot_trip_status,
-    plot_status_by_pickup_point,
-    plot_daily_requests,
-    plot_time_slot_distribution,
-    plot_hourly_requests,
-    plot_request_heatmap,
-    plot_trip_duration_boxplot,
-    plot_trip_duration_scatter,
-    plot_top_drivers,
-    plot_driver_availability_by_day,
-    plot_driver_availability_by_slot,
-    plot_requests_per_weekday,
-    plot_location_clusters
-)
-
-# Clustering tools
-from .location_clustering import add_random_coordinates, perform_clustering
\ No newline at end of file
+import importlib
+
+# Public name -> module defining it
+_EXPORTS = {
+    'load_data': 'data_loading_and_exploration',
+    'explore_data': 'data_loading_and_exploration',
+    'clean_data': 'data_cleaning_and_preprocessing',
+    'parse_dates': 'data_cleaning_and_preprocessing',
+    'engineer_features': 'data_feature_engineering',
+    'save_data': 'save_transformed_data',
+    'build_request_cube': 'summary_cube',
+    'merge_cubes': 'summary_cube',
+    'build_driver_stats': 'driver_stats',
+    'top_drivers': 'driver_stats',
+    'gap_analysis': 'gap_analysis',
+    'stream_gap_analysis': 'gap_analysis',
+    'QueryService': 'query_service',
+    'QueryServer': 'query_service',
+    'run_chunked_pipeline': 'chunked_pipeline',
+    'run_parallel_pipeline': 'parallel_pipeline',
+    'ingest_file': 'incremental_ingestion',
+    'load_feature_store': 'incremental_ingestion',
+    'load_summary_cube': 'incremental_ingestion',
+    'lazy_query': 'lazy_pipeline',
+    'plan_query': 'lazy_pipeline',
+    'execute_plan': 'lazy_pipeline',
+
+    # Visualizations
+    'plot_pickup_point_distribution': 'data_visualization',
+    'plot_trip_status': 'data_visualization',
+    'plot_status_by_pickup_point': 'data_visualization',
+    'plot_daily_requests': 'data_visualization',
+    'plot_time_slot_distribution': 'data_visualization',
+    'plot_hourly_requests': 'data_visualization',
+    'plot_request_heatmap': 'data_visualization',
+    'plot_trip_duration_boxplot': 'data_visualization',
+    'plot_trip_duration_scatter': 'data_visualization',
+    'plot_top_drivers': 'data_visualization',
+    'plot_driver_availability_by_day': 'data_visualization',
+    'plot_driver_availability_by_slot': 'data_visualization',
+    'plot_requests_per_weekday': 'data_visualization',
+    'plot_location_clusters': 'data_visualization',
+    'render_all_plots': 'plot_rendering',
+
+    # Caching
+    'run_cached_pipeline': 'pipeline_cache',
+    'run_instrumented_pipeline': 'pipeline_runner',
+
+    # Clustering tools
+    'add_random_coordinates': 'location_clustering',
+    'perform_clustering': 'location_clustering',
+    'sweep_n_clusters': 'location_clustering',
+    'cluster_with_saved_model': 'location_clustering',
+    'SpatialIndex': 'spatial_index',
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted({*globals(), *_EXPORTS})
\ No newline at end of file
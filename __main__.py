@@ -0,0 +1,5 @@
+# Entry point for `python -m src` (see cli.py for the subcommands)
+
+from .cli import main
+
+main()
@@ -0,0 +1,31 @@
+# ================================================================
+# Benchmark: clustering engines (quality vs speed by dataset size)
+# Run from the project root:  python -m src.benchmarks.bench_clustering
+# ================================================================
+
+import argparse
+
+import pandas as pd
+
+from src.location_clustering import CLUSTERING_ENGINES, add_random_coordinates, perform_clustering
+
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser()
+    cli.add_argument('--sizes', type=int, nargs='+', default=[100_000, 1_000_000])
+    cli.add_argument('--dtype', default='float32', choices=['float32', 'float64'])
+    cli.add_argument('--batch-size', type=int, default=4096)
+    args = cli.parse_args()
+
+    results = []
+    for n_rows in args.sizes:
+        df = add_random_coordinates(pd.DataFrame(index=range(n_rows)))
+        for engine in CLUSTERING_ENGINES:
+            stats = perform_clustering(df, engine=engine, dtype=args.dtype,
+                                       batch_size=args.batch_size).attrs['clustering']
+            results.append({'rows': n_rows, **stats})
+
+    table = pd.DataFrame(results)
+    table['total_seconds'] = table['fit_seconds'] + table['assign_seconds']
+    baseline = table[table['engine'] == 'kmeans'].set_index('rows')['inertia']
+    table['inertia_vs_kmeans'] = table['inertia'] / table['rows'].map(baseline)
+    print(table.drop(columns=['n_clusters', 'centers']).round(4).to_string(index=False))
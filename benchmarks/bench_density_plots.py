@@ -0,0 +1,60 @@
+# ================================================================
+# Benchmark: per-point scatter vs density rendering by row count
+# Run from the project root:  python -m src.benchmarks.bench_density_plots
+# ================================================================
+
+import argparse
+import contextlib
+import io
+import time
+
+import pandas as pd
+from matplotlib.figure import Figure
+
+from src.benchmarks.synthetic_data import generate_requests
+from src.data_cleaning_and_preprocessing import clean_data
+from src.data_feature_engineering import engineer_features
+from src.data_visualization import plot_location_clusters, plot_trip_duration_scatter
+from src.location_clustering import add_random_coordinates, perform_clustering
+
+PLOTS = {'location_clusters': plot_location_clusters,
+         'trip_duration_scatter': plot_trip_duration_scatter}
+
+def render(plot, df, mode, fmt):
+    """
+    Draws one plot and saves it in memory; returns (seconds, bytes).
+    """
+    start = time.perf_counter()
+    fig = Figure(figsize=(8, 5))
+    plot(df, ax=fig.subplots(), mode=mode)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=fmt, dpi=100, bbox_inches='tight')
+    return time.perf_counter() - start, buffer.tell()
+
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser()
+    cli.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    cli.add_argument('--max-scatter', type=int, default=100_000,
+                     help='largest size drawn point by point (slow, huge SVGs)')
+    cli.add_argument('--formats', nargs='+', default=['png', 'svg'])
+    args = cli.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        full = perform_clustering(add_random_coordinates(
+            engineer_features(clean_data(generate_requests(max(args.sizes), seed=0, duplicate_rate=0)))),
+            engine='sample')
+
+    rows = []
+    for n_rows in args.sizes:
+        df = full.iloc[:n_rows]
+        for name, plot in PLOTS.items():
+            for mode in ['scatter', 'density']:
+                if mode == 'scatter' and n_rows > args.max_scatter:
+                    continue
+                for fmt in args.formats:
+                    seconds, size = render(plot, df, mode, fmt)
+                    rows.append({'rows': n_rows, 'plot': name, 'mode': mode, 'format': fmt,
+                                 'seconds': round(seconds, 3), 'kb': round(size / 1024, 1)})
+
+    table = pd.DataFrame(rows)
+    print(table.to_string(index=False))
@@ -0,0 +1,63 @@
+# ================================================================
+# Benchmark: row-wise vs vectorized engineer_features
+# Run from the project root:  python -m src.benchmarks.bench_engineer_features
+# ================================================================
+
+import argparse
+import time
+
+import pandas as pd
+
+from src.data_cleaning_and_preprocessing import clean_data
+from src.data_feature_engineering import engineer_features, get_time_period
+
+# ----------------------------------------------------------------
+# Previous implementation (one Python callback per row), kept as reference
+# ----------------------------------------------------------------
+def engineer_features_rowwise(df):
+    df = df[df['Request timestamp'].notna()].copy()
+    df['Request hour'] = df['Request timestamp'].dt.hour.astype('Int64')
+    df['Request day'] = df['Request timestamp'].dt.dayofweek.astype('Int64').map({
+        0: 'Monday', 1: 'Tuesday', 2: 'Wednesday',
+        3: 'Thursday', 4: 'Friday', 5: 'Saturday', 6: 'Sunday'
+    })
+    df['Time slot'] = df['Request hour'].apply(get_time_period).astype('category')
+    df['Trip duration'] = (df['Drop timestamp'] - df['Request timestamp']).apply(
+        lambda x: str(x).replace("0 days ", "") if pd.notna(x) else "00:00:00"
+    )
+    df['Is Completed'] = df['Status'] == 'Trip Completed'
+    df['Driver Available'] = df['Driver id'].apply(lambda x: True if pd.notna(x) and x > 0 else False)
+    df['Request Date'] = df['Request timestamp'].dt.date
+    df['Trip Duration Mins'] = df['Trip duration'].apply(
+        lambda x: round(pd.Timedelta(x).total_seconds() / 60, 1) if pd.notna(x) else 0
+    )
+    return df
+
+# ----------------------------------------------------------------
+# Build a cleaned frame of the requested size by tiling the sample
+# ----------------------------------------------------------------
+def make_clean_frame(path, n_rows):
+    sample = clean_data(pd.read_csv(path, sep='\t'))
+    reps = -(-n_rows // len(sample))
+    df = pd.concat([sample] * reps, ignore_index=True).iloc[:n_rows].copy()
+    df['Request id'] = range(1, len(df) + 1)
+    return df
+
+def _timed(func, df):
+    start = time.perf_counter()
+    out = func(df.copy())
+    return out, time.perf_counter() - start
+
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser(description=__doc__)
+    cli.add_argument('--path', default='data/Uber Request Data.csv')
+    cli.add_argument('--rows', type=int, default=1_000_000)
+    args = cli.parse_args()
+
+    df = make_clean_frame(args.path, args.rows)
+    old, t_old = _timed(engineer_features_rowwise, df)
+    new, t_new = _timed(lambda frame: engineer_features(frame, compact=False), df)
+
+    pd.testing.assert_frame_equal(old, new)
+    print(f"\n⏱️ {len(df):,} rows | row-wise: {t_old:.2f}s | vectorized: {t_new:.2f}s "
+          f"| speedup: {t_old / t_new:.1f}x (outputs identical)")
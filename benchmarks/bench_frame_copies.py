@@ -0,0 +1,114 @@
+# ================================================================
+# Benchmark: hidden full-frame copies made by each pipeline stage
+# Run from the project root:  python -m src.benchmarks.bench_frame_copies
+# ================================================================
+
+import argparse
+import contextlib
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from pandas.core.internals import blocks
+
+from src.benchmarks.synthetic_data import generate_requests
+from src.data_cleaning_and_preprocessing import clean_data
+from src.data_feature_engineering import engineer_features
+from src.location_clustering import add_random_coordinates, perform_clustering
+
+# ----------------------------------------------------------------
+# Count the bytes pandas copies: row takes (filters) and deep copies,
+# hooked at the block level where every column copy ends up
+# ----------------------------------------------------------------
+@contextlib.contextmanager
+def count_copied_bytes():
+    copied = {'bytes': 0}
+    patched = []
+
+    def counting(original, is_copy):
+        def wrapper(self, *args, **kwargs):
+            block = original(self, *args, **kwargs)
+            if is_copy(*args, **kwargs):
+                copied['bytes'] += block.values.nbytes
+            return block
+        return wrapper
+
+    for cls in [blocks.Block, *blocks.Block.__subclasses__()]:
+        if 'take_nd' in vars(cls):
+            patched.append((cls, 'take_nd', cls.take_nd))
+            cls.take_nd = counting(cls.take_nd, lambda indexer, axis, *a, **k: axis == 1)
+        if 'copy' in vars(cls):
+            patched.append((cls, 'copy', cls.copy))
+            cls.copy = counting(cls.copy, lambda *a, deep=True, **k: deep)
+    try:
+        yield copied
+    finally:
+        for cls, name, original in patched:
+            setattr(cls, name, original)
+
+def _frame_bytes(df):
+    return int(df.memory_usage(index=False, deep=False).sum())
+
+def _fingerprint(df):
+    return list(df.columns), pd.util.hash_pandas_object(df, index=True).sum()
+
+def measure_stage(name, func, df):
+    """
+    Runs one stage and reports copied bytes as full-frame equivalents of
+    its input, the traced memory peak and whether the input was modified.
+    """
+    before = _fingerprint(df)
+    tracemalloc.start()
+    start = time.perf_counter()
+    with count_copied_bytes() as copied:
+        out = func(df)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    size = _frame_bytes(df)
+    return out, {
+        'stage': name,
+        'seconds': round(seconds, 3),
+        'frame_copies': round(copied['bytes'] / size, 2),
+        'peak_frames': round(peak / size, 2),
+        'mutates_input': _fingerprint(df) != before,
+    }
+
+def with_invalid_rows(raw, rate, seed=0):
+    """
+    Corrupts a fraction of the rows the way the row filters expect:
+    negative Request / Driver ids and unreadable request timestamps.
+    """
+    rng = np.random.default_rng(seed)
+    raw = raw.copy()
+    for column, bad_value in [('Request id', -1), ('Driver id', -1.0), ('Request timestamp', 'n/a')]:
+        raw.loc[rng.random(len(raw)) < rate, column] = bad_value
+    return raw
+
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser()
+    cli.add_argument('--rows', type=int, default=500_000)
+    cli.add_argument('--invalid-rate', type=float, default=0.002,
+                     help='share of rows failing each row filter')
+    args = cli.parse_args()
+
+    raw = with_invalid_rows(generate_requests(args.rows, seed=0), args.invalid_rate)
+    stages = [
+        ('clean_data', clean_data),
+        ('engineer_features', engineer_features),
+        ('add_random_coordinates', add_random_coordinates),
+        ('perform_clustering', lambda d: perform_clustering(d, engine='sample')),
+    ]
+
+    df, records = raw, []
+    with contextlib.redirect_stdout(None):
+        for name, func in stages:
+            df, record = measure_stage(name, func, df)
+            records.append(record)
+
+    table = pd.DataFrame(records)
+    print(f"\n📋 {args.rows:,} rows; copies and peak in units of the stage's input frame:")
+    print(table.to_string(index=False))
+    print(f"Total full-frame copies per run: {table['frame_copies'].sum():.2f}")
@@ -0,0 +1,78 @@
+# ================================================================
+# Regression check: import time of each CLI subcommand (python -X importtime)
+# Run from the project root:  python -m src.benchmarks.bench_import_time
+# Exits with status 1 when a subcommand goes over its import budget or
+# imports a forbidden module, so it can gate a CI job or pre-release check.
+# ================================================================
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+import pandas as pd
+
+from src.benchmarks.synthetic_data import write_requests
+
+# Import-time budgets in milliseconds. clean/features must not pull in
+# matplotlib, seaborn or scikit-learn.
+IMPORT_BUDGET_MS = {'clean': 1000, 'features': 1000, 'cluster': 3000, 'plot': 3500}
+FORBIDDEN_MODULES = {'clean': ['matplotlib', 'seaborn', 'sklearn'],
+                     'features': ['matplotlib', 'seaborn', 'sklearn']}
+
+def parse_importtime(stderr):
+    """
+    Total import time (ms) and the set of top-level packages imported,
+    from the `-X importtime` report.
+    """
+    total_us, packages = 0, set()
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if not name[1:].startswith(' '):  # top-level entries only
+            total_us += int(cumulative)
+        packages.add(name.strip().split('.')[0])
+    return total_us / 1000, packages
+
+def measure_subcommand(args, cwd):
+    env = {**os.environ, 'PYTHONPATH': cwd}
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-m', 'src', *args],
+                            capture_output=True, text=True, cwd=cwd, env=env, check=True)
+    return parse_importtime(result.stderr)
+
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser()
+    cli.add_argument('--repeat', type=int, default=3, help='runs per subcommand (best is kept)')
+    args = cli.parse_args()
+
+    # Folder containing the src package, for the subprocesses
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    with tempfile.TemporaryDirectory() as tmp:
+        raw, clean = os.path.join(tmp, 'raw.csv'), os.path.join(tmp, 'clean.parquet')
+        features, clustered = os.path.join(tmp, 'features.parquet'), os.path.join(tmp, 'clustered.parquet')
+        write_requests(raw, 2000)
+        commands = {
+            'clean': ['clean', '--input', raw, '--output', clean],
+            'features': ['features', '--input', clean, '--output', features],
+            'cluster': ['cluster', '--input', features, '--output', clustered],
+            'plot': ['plot', '--input', clustered, '--plot-dir', tmp, '--plots', 'hourly_requests',
+                     '--n-jobs', '1'],
+        }
+
+        rows = []
+        for name, command in commands.items():
+            runs = [measure_subcommand(command, root) for _ in range(args.repeat)]
+            milliseconds, packages = min(runs, key=lambda run: run[0])
+            forbidden = [m for m in FORBIDDEN_MODULES.get(name, []) if m in packages]
+            rows.append({'subcommand': name, 'import_ms': round(milliseconds, 1),
+                         'budget_ms': IMPORT_BUDGET_MS[name], 'forbidden_imports': ', '.join(forbidden),
+                         'ok': milliseconds <= IMPORT_BUDGET_MS[name] and not forbidden})
+
+    table = pd.DataFrame(rows)
+    print(table.to_string(index=False))
+    if not table['ok'].all():
+        print("❌ Import budget exceeded")
+        sys.exit(1)
+    print("✅ All subcommands within their import budget")
@@ -0,0 +1,76 @@
+# ================================================================
+# Benchmark: lazy queries vs the eager pipeline for dashboard queries
+# Run from the project root:  python -m src.benchmarks.bench_lazy_pipeline
+# ================================================================
+
+import argparse
+import contextlib
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from src.benchmarks.synthetic_data import write_requests
+from src.data_cleaning_and_preprocessing import clean_data
+from src.data_feature_engineering import engineer_features
+from src.data_loading_and_exploration import load_data
+from src.lazy_pipeline import _row_mask, execute_plan, plan_query
+from src.location_clustering import add_random_coordinates, cluster_with_saved_model
+
+# Typical dashboard queries: output columns + filters
+QUERIES = {
+    'airport_july_hours': (['Request hour', 'Status'],
+                           {'pickup_point': 'Airport', 'start': '2016-07-01', 'end': '2016-07-31'}),
+    'weekday_counts': (['Request day'], {}),
+    'city_gaps_by_slot': (['Time slot', 'Status'],
+                          {'pickup_point': 'City', 'status': ['Cancelled', 'No Cars Available']}),
+    'morning_peak_durations': (['Trip Duration Mins'],
+                               {'status': 'Trip Completed', 'hour': [7, 8, 9], 'start': '2016-07-15',
+                                'end': '2016-07-15'}),
+    'airport_clusters': (['cluster', 'Status'], {'pickup_point': 'Airport'}),
+}
+
+def run_eager(path, model_path, n_clusters=5):
+    """
+    The eager path of main() (run_pipeline_stages without the exploration):
+    every stage on every row, clustered with the saved model.
+    """
+    df = engineer_features(clean_data(load_data(path)))
+    return cluster_with_saved_model(add_random_coordinates(df), model_path, n_clusters=n_clusters)
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(None):
+        out = func(*args, **kwargs)
+    return time.perf_counter() - start, out
+
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser()
+    cli.add_argument('--rows', type=int, default=500_000)
+    cli.add_argument('--input', help='raw export to query (default: synthetic June-August data)')
+    args = cli.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.input
+        if path is None:
+            path = os.path.join(tmp, 'raw.csv')
+            write_requests(path, args.rows, start='2016-06-01', days=92)
+
+        # The first eager run fits and saves the model; the timed one and
+        # the lazy queries then label rows with it, as main() does
+        model_path = os.path.join(tmp, 'cluster_model.pkl')
+        timed(run_eager, path, model_path)
+        eager_seconds, full = timed(run_eager, path, model_path)
+        rows = []
+        for name, (columns, filters) in QUERIES.items():
+            plan = plan_query(columns, **filters)
+            seconds, lazy = timed(execute_plan, plan, path, model_path=model_path)
+            expected = full.loc[_row_mask(full, plan), columns]
+            pd.testing.assert_frame_equal(lazy, expected, check_dtype=False, check_categorical=False)
+            rows.append({'query': name, 'rows_out': len(lazy), 'eager_s': round(eager_seconds, 3),
+                         'lazy_s': round(seconds, 3), 'speedup': round(eager_seconds / seconds, 1),
+                         'pushdown': bool(plan['pushdown']), 'clustering': plan['clustering']})
+
+    print("✅ Lazy results match the eager pipeline")
+    print(pd.DataFrame(rows).to_string(index=False))
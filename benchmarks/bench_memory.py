@@ -0,0 +1,23 @@
+# ================================================================
+# Benchmark: memory of the full vs compact engineered frame
+# Run from the project root:  python -m src.benchmarks.bench_memory --rows 10000000
+# ================================================================
+
+import argparse
+
+from src.benchmarks.bench_engineer_features import make_clean_frame
+from src.data_feature_engineering import engineer_features, memory_report
+
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser()
+    cli.add_argument('--path', default='data/Uber Request Data.csv')
+    cli.add_argument('--rows', type=int, default=1_000_000)
+    args = cli.parse_args()
+
+    df = make_clean_frame(args.path, args.rows)
+    full = engineer_features(df.copy(), compact=False)
+    compact = engineer_features(df, compact=True)
+
+    report = memory_report(full, compact)
+    print(f"\n📏 {len(df):,} rows, bytes per column (deep):")
+    print(report.to_string())
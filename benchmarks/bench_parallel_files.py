@@ -0,0 +1,47 @@
+# ================================================================
+# Benchmark: multi-file pipeline throughput by number of workers
+# Run from the project root:  python -m src.benchmarks.bench_parallel_files
+# ================================================================
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from src.benchmarks.synthetic_data import generate_requests
+from src.parallel_pipeline import run_parallel_pipeline
+
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser()
+    cli.add_argument('--files', type=int, default=8)
+    cli.add_argument('--rows-per-file', type=int, default=200_000)
+    cli.add_argument('--workers', type=int, nargs='+',
+                     default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    args = cli.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # One file per city-day; neighbouring files share 10% of their Request ids
+        for i in range(args.files):
+            raw = generate_requests(args.rows_per_file, seed=i)
+            raw['Request id'] += int(i * args.rows_per_file * 0.9)
+            raw.to_csv(os.path.join(tmp, f'requests-{i:03d}.csv'), sep='\t', index=False)
+
+        rows, results = None, []
+        for workers in args.workers:
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                df = run_parallel_pipeline(tmp, n_jobs=workers)
+            seconds = time.perf_counter() - start
+            rows = len(df)
+            results.append({'workers': workers, 'seconds': seconds,
+                            'rows_per_second': args.files * args.rows_per_file / seconds})
+
+    table = pd.DataFrame(results)
+    table['speedup'] = table['seconds'].iloc[0] / table['seconds']
+    print(f"\n🧵 {args.files} files x {args.rows_per_file:,} rows -> {rows:,} unique requests "
+          f"({os.cpu_count()} cores available)")
+    print(table.round(3).to_string(index=False))
@@ -0,0 +1,83 @@
+# ================================================================
+# Benchmark: spatial index queries vs brute-force scans
+# Run from the project root:  python -m src.benchmarks.bench_spatial_index
+# ================================================================
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.location_clustering import add_random_coordinates, assign_clusters, perform_clustering
+from src.spatial_index import SpatialIndex
+
+def _per_query_ms(func, n_queries, repeat=3):
+    best = min(_timed(func) for _ in range(repeat))
+    return best / n_queries * 1e3
+
+def _timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+# ----------------------------------------------------------------
+# Brute force: one full scan per query point
+# ----------------------------------------------------------------
+def brute_radius(points, queries, radius):
+    return [np.flatnonzero(((points - q) ** 2).sum(axis=1) <= radius ** 2) for q in queries]
+
+def brute_nearest(points, queries, k):
+    return [np.argpartition(((points - q) ** 2).sum(axis=1), k)[:k] for q in queries]
+
+def brute_bbox(points, boxes):
+    return [np.flatnonzero((points[:, 0] >= b[0]) & (points[:, 1] >= b[1])
+                           & (points[:, 0] <= b[2]) & (points[:, 1] <= b[3])) for b in boxes]
+
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser()
+    cli.add_argument('--rows', type=int, default=1_000_000)
+    cli.add_argument('--queries', type=int, default=200)
+    cli.add_argument('--radius', type=float, default=0.5)
+    cli.add_argument('--k', type=int, default=10)
+    cli.add_argument('--incoming', type=int, default=1_000_000, help='points to assign to clusters')
+    args = cli.parse_args()
+
+    df = pd.DataFrame({'Request id': np.arange(args.rows)})
+    df = perform_clustering(add_random_coordinates(df), engine='sample')
+
+    start = time.perf_counter()
+    index = SpatialIndex(df)
+    build_seconds = time.perf_counter() - start
+
+    rng = np.random.default_rng(0)
+    queries = np.column_stack([rng.uniform(-20, 20, args.queries), rng.uniform(-10, 10, args.queries)])
+    boxes = np.column_stack([queries, queries + 1.0])
+    incoming = np.column_stack([rng.uniform(-20, 20, args.incoming), rng.uniform(-10, 10, args.incoming)])
+    centers = np.asarray(df.attrs['clustering']['centers'])
+    points = index.points
+
+    # Same answers before timing anything
+    assert all(np.array_equal(a, b) for a, b in
+               zip(index.within_radius(queries, args.radius), brute_radius(points, queries, args.radius)))
+    assert all(np.array_equal(a, b) for a, b in zip(index.within_bbox(boxes), brute_bbox(points, boxes)))
+    assert np.array_equal(index.assign(incoming)[0], assign_clusters(centers, incoming)[0])
+
+    n = args.queries
+    table = pd.DataFrame([
+        {'query': f'radius {args.radius}',
+         'index_ms': _per_query_ms(lambda: index.within_radius(queries, args.radius), n),
+         'brute_ms': _per_query_ms(lambda: brute_radius(points, queries, args.radius), n)},
+        {'query': f'{args.k} nearest',
+         'index_ms': _per_query_ms(lambda: index.nearest(queries, args.k), n),
+         'brute_ms': _per_query_ms(lambda: brute_nearest(points, queries, args.k), n)},
+        {'query': 'bounding box 1x1',
+         'index_ms': _per_query_ms(lambda: index.within_bbox(boxes), n),
+         'brute_ms': _per_query_ms(lambda: brute_bbox(points, boxes), n)},
+        {'query': f'assign {args.incoming:,} points (total)',
+         'index_ms': _per_query_ms(lambda: index.assign(incoming), 1),
+         'brute_ms': _per_query_ms(lambda: assign_clusters(centers, incoming), 1)},
+    ])
+    table['speedup'] = table['brute_ms'] / table['index_ms']
+    print(f"\n📍 {args.rows:,} points, index built in {build_seconds:.2f}s; latency per query:")
+    print(table.round(4).to_string(index=False))
@@ -0,0 +1,61 @@
+# ================================================================
+# Benchmark: CSV vs Parquet vs Feather for the feature table
+# Run from the project root:  python -m src.benchmarks.bench_storage_formats
+# ================================================================
+
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from src.benchmarks.bench_engineer_features import make_clean_frame
+from src.data_feature_engineering import compact_features, engineer_features
+from src.data_loading_and_exploration import load_data
+from src.save_transformed_data import save_data
+
+DASHBOARD_COLUMNS = ['Request hour', 'Status']
+
+# ----------------------------------------------------------------
+# Reading the CSV back into the same types the pipeline produced
+# ----------------------------------------------------------------
+def read_typed_csv(path, columns=None):
+    timestamps = ['Request timestamp', 'Drop timestamp', 'Request Date']
+    df = pd.read_csv(path, usecols=columns,
+                     parse_dates=[c for c in timestamps if columns is None or c in columns])
+    return compact_features(df, verbose=False)
+
+def _timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser()
+    cli.add_argument('--path', default='data/Uber Request Data.csv')
+    cli.add_argument('--rows', type=int, default=1_000_000)
+    args = cli.parse_args()
+
+    df = engineer_features(make_clean_frame(args.path, args.rows))
+
+    readers = {
+        'csv': read_typed_csv,
+        'parquet': load_data,
+        'feather': load_data,
+    }
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt, reader in readers.items():
+            out = os.path.join(tmp, f'features.{fmt}')
+            write_s = _timed(save_data, df, out)
+            results.append({
+                'format': fmt,
+                'size_mb': os.path.getsize(out) / 1e6,
+                'write_s': write_s,
+                'read_all_s': _timed(reader, out),
+                'read_dashboard_s': _timed(reader, out, columns=DASHBOARD_COLUMNS),
+            })
+
+    print(f"\n⏱️ {len(df):,} rows")
+    print(pd.DataFrame(results).round(3).to_string(index=False))
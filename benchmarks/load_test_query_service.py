@@ -0,0 +1,103 @@
+# ================================================================
+# Load test: latency percentiles and throughput of the query service
+# Run from the project root (starts a local server on a free port):
+#   python -m src.benchmarks.load_test_query_service --source output/feature_store
+# or against a running instance:
+#   python -m src.benchmarks.load_test_query_service --url http://127.0.0.1:8765
+# ================================================================
+
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+import numpy as np
+
+from src.query_service import QueryServer, QueryService
+
+# ----------------------------------------------------------------
+# Dashboard-like query mix: a few distinct queries, asked repeatedly
+# ----------------------------------------------------------------
+def make_queries(n_distinct, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = [f'2016-07-{d}' for d in range(11, 16)]
+    queries = []
+    for _ in range(n_distinct):
+        query = {}
+        if rng.random() < 0.5:
+            start = rng.integers(0, len(dates))
+            query['start'], query['end'] = dates[start], dates[rng.integers(start, len(dates))]
+        if rng.random() < 0.5:
+            query['pickup_point'] = rng.choice(['Airport', 'City'])
+        if rng.random() < 0.3:
+            query['status'] = rng.choice(['Cancelled', 'No Cars Available', 'Trip Completed'])
+        if rng.random() < 0.4:
+            query['hour'] = sorted(rng.choice(24, size=rng.integers(1, 4), replace=False).tolist())
+        query['group_by'] = rng.choice(['Request hour', 'Status', 'Time slot', 'Request Date'])
+        queries.append(query)
+    return queries
+
+def _timed_get(url):
+    start = time.perf_counter()
+    with urlopen(url) as response:
+        response.read()
+    return time.perf_counter() - start
+
+def run_load_test(base_url, queries, n_requests, concurrency, seed=0):
+    """
+    Sends n_requests GET /query requests drawn from queries with
+    `concurrency` client threads.
+
+    Returns:
+    - dict with p50/p99/max latency (ms) and queries per second
+    """
+    rng = np.random.default_rng(seed)
+    urls = [f"{base_url}/query?{urlencode(queries[i], doseq=True)}"
+            for i in rng.integers(0, len(queries), size=n_requests)]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as clients:
+        latencies = np.array(list(clients.map(_timed_get, urls))) * 1e3
+    seconds = time.perf_counter() - start
+
+    return {
+        'requests': n_requests,
+        'concurrency': concurrency,
+        'p50_ms': round(float(np.percentile(latencies, 50)), 3),
+        'p99_ms': round(float(np.percentile(latencies, 99)), 3),
+        'max_ms': round(float(latencies.max()), 3),
+        'qps': round(n_requests / seconds, 1),
+    }
+
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser()
+    cli.add_argument('--url', help='query an already running server instead of starting one')
+    cli.add_argument('--source', default='output/feature_store')
+    cli.add_argument('--requests', type=int, default=5000)
+    cli.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32])
+    cli.add_argument('--distinct', type=int, default=200, help='distinct queries in the mix')
+    cli.add_argument('--threads', type=int, default=8, help='server thread pool size')
+    args = cli.parse_args()
+
+    server = None
+    base_url = args.url
+    if base_url is None:
+        server = QueryServer(QueryService(args.source), port=0, n_threads=args.threads)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f'http://127.0.0.1:{server.server_port}'
+
+    queries = make_queries(args.distinct)
+    try:
+        for concurrency in args.concurrency:
+            result = run_load_test(base_url, queries, args.requests, concurrency)
+            print(f"⚡ concurrency {concurrency:>3}: p50 {result['p50_ms']:.2f} ms, "
+                  f"p99 {result['p99_ms']:.2f} ms, {result['qps']:.0f} queries/s")
+        with urlopen(f'{base_url}/stats') as response:
+            print(f"🗃️ Cache: {json.load(response)}")
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,112 @@
+# ================================================================
+# Benchmark harness: time and memory of each pipeline stage by size
+# Run from the project root:
+#   python -m src.benchmarks.run_benchmarks --sizes 10000 100000 1000000 --output bench.json
+# ================================================================
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import pandas as pd
+import sklearn
+
+from src.benchmarks.synthetic_data import generate_requests
+from src.data_cleaning_and_preprocessing import clean_data
+from src.data_feature_engineering import engineer_features
+from src.location_clustering import add_random_coordinates, perform_clustering
+from src.plot_rendering import render_all_plots
+
+# ----------------------------------------------------------------
+# Measure one stage: wall time, peak traced memory, rows in / out
+# ----------------------------------------------------------------
+def measure(stage, func, *args, trace_memory=True):
+    rows_in = len(args[0]) if args and hasattr(args[0], '__len__') else None
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    out = func(*args)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+    if trace_memory:
+        tracemalloc.stop()
+    return out, {
+        'stage': stage,
+        'seconds': round(seconds, 4),
+        'peak_mb': round(peak / 1e6, 1) if trace_memory else None,
+        'rows_in': rows_in,
+        'rows_out': len(out) if hasattr(out, '__len__') else None,
+    }
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(__file__), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+# ----------------------------------------------------------------
+# Run every stage at every size
+# ----------------------------------------------------------------
+def run_benchmarks(sizes, seed=0, trace_memory=True, plots=True):
+    """
+    Generates synthetic data at each size and measures generate, clean_data,
+    engineer_features, coordinates + clustering and (optionally) rendering
+    all plots.
+
+    Returns:
+    - dict ready to be written as JSON (environment + one record per stage)
+    """
+    records = []
+    for n_rows in sizes:
+        print(f"\n⏱️ Benchmarking {n_rows:,} rows")
+        stages = []
+        raw, rec = measure('generate', generate_requests, n_rows, seed, trace_memory=trace_memory)
+        stages.append(rec)
+        df, rec = measure('clean_data', clean_data, raw, trace_memory=trace_memory)
+        stages.append(rec)
+        df, rec = measure('engineer_features', engineer_features, df, trace_memory=trace_memory)
+        stages.append(rec)
+        df, rec = measure('clustering', lambda d: perform_clustering(add_random_coordinates(d)),
+                          df, trace_memory=trace_memory)
+        stages.append(rec)
+        if plots:
+            with tempfile.TemporaryDirectory() as tmp:
+                _, rec = measure('render_plots', lambda d: render_all_plots(d, tmp, n_jobs=1),
+                                 df, trace_memory=trace_memory)
+            stages.append(rec)
+        records.extend({'rows': n_rows, **rec} for rec in stages)
+
+    return {
+        'commit': _git_commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'scikit-learn': sklearn.__version__,
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'results': records,
+    }
+
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser()
+    cli.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    cli.add_argument('--seed', type=int, default=0)
+    cli.add_argument('--output', default='benchmark_results.json')
+    cli.add_argument('--no-memory', action='store_true', help='skip tracemalloc; its overhead inflates the timings of Python-heavy stages')
+    cli.add_argument('--no-plots', action='store_true')
+    args = cli.parse_args()
+
+    report = run_benchmarks(args.sizes, args.seed, trace_memory=not args.no_memory,
+                            plots=not args.no_plots)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print(pd.DataFrame(report['results']).to_string(index=False))
+    print(f"\n💾 Results written to {args.output}")
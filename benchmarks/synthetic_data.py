@@ -0,0 +1,87 @@
+# ================================================================
+# Synthetic Uber request data with the schema of the raw export
+# ================================================================
+
+import numpy as np
+import pandas as pd
+
+# Shares observed in 'Uber Request Data.csv'
+STATUS_SHARES = {'Trip Completed': 0.42, 'No Cars Available': 0.39, 'Cancelled': 0.19}
+PICKUP_SHARES = {'City': 0.52, 'Airport': 0.48}
+HOURLY_REQUESTS = [100, 85, 100, 92, 203, 445, 398, 406, 423, 431, 243, 171,
+                   184, 161, 136, 171, 159, 418, 510, 473, 492, 449, 304, 194]
+
+# Timestamp layouts of the export and how often each appears:
+# '13-07-2016 08:33:16', '11/7/2016 11:51', '11/7/2016 9:05'
+LAYOUT_SHARES = [0.60, 0.24, 0.16]
+
+def _format_timestamps(ts, layouts):
+    """
+    Formats timestamps with the export's three layouts (per-row choice),
+    using vectorized string concatenation only.
+    """
+    ts = pd.Series(ts)
+    day, month, year = ts.dt.day.astype(str), ts.dt.month.astype(str), ts.dt.year.astype(str)
+    hour, minute = ts.dt.hour.astype(str), ts.dt.minute.astype(str).str.zfill(2)
+    second = ts.dt.second.astype(str).str.zfill(2)
+
+    dashed = (day.str.zfill(2) + '-' + month.str.zfill(2) + '-' + year + ' '
+              + hour.str.zfill(2) + ':' + minute + ':' + second)
+    slashed = day + '/' + month + '/' + year + ' '
+    return np.select(
+        [layouts == 0, layouts == 1],
+        [dashed, slashed + hour.str.zfill(2) + ':' + minute],
+        default=slashed + hour + ':' + minute,
+    )
+
+def generate_requests(n_rows, seed=0, start='2016-07-11', days=5, n_drivers=300,
+                      duplicate_rate=0.01):
+    """
+    Generates a raw request table like 'Uber Request Data.csv':
+    - Status / Pickup point mix and hourly demand curve of the real data
+    - Driver id missing for 'No Cars Available'
+    - Drop timestamp only for completed trips
+    - the three timestamp layouts, mixed row by row
+    - duplicate_rate of the rows repeated as exact duplicates
+
+    Returns:
+    - DataFrame with the raw columns (timestamps as strings)
+    """
+    rng = np.random.default_rng(seed)
+    n_unique = n_rows - int(n_rows * duplicate_rate)
+
+    status = rng.choice(list(STATUS_SHARES), size=n_unique, p=list(STATUS_SHARES.values()))
+    pickup = rng.choice(list(PICKUP_SHARES), size=n_unique, p=list(PICKUP_SHARES.values()))
+
+    hours = rng.choice(24, size=n_unique, p=np.array(HOURLY_REQUESTS) / sum(HOURLY_REQUESTS))
+    seconds = (rng.integers(0, days, size=n_unique) * 86400 + hours * 3600
+               + rng.integers(0, 3600, size=n_unique))
+    requested = pd.Timestamp(start) + pd.to_timedelta(seconds, unit='s')
+    trip_seconds = np.clip(rng.normal(52, 14, size=n_unique), 20, 90) * 60
+    dropped = requested + pd.to_timedelta(trip_seconds.astype(np.int64), unit='s')
+
+    completed = status == 'Trip Completed'
+    no_car = status == 'No Cars Available'
+    driver = rng.integers(1, n_drivers + 1, size=n_unique).astype('float64')
+    driver[no_car] = np.nan
+
+    layouts = rng.choice(3, size=n_unique, p=LAYOUT_SHARES)
+    drop_text = pd.Series(_format_timestamps(dropped, layouts)).where(completed)
+
+    df = pd.DataFrame({
+        'Request id': np.arange(1, n_unique + 1),
+        'Pickup point': pickup,
+        'Driver id': driver,
+        'Status': status,
+        'Request timestamp': _format_timestamps(requested, layouts),
+        'Drop timestamp': drop_text,
+    })
+
+    duplicates = df.sample(n=n_rows - n_unique, random_state=seed, replace=True)
+    return pd.concat([df, duplicates], ignore_index=True)
+
+def write_requests(path, n_rows, seed=0, **kwargs):
+    """
+    Writes a synthetic raw file (tab-separated, like the real export).
+    """
+    generate_requests(n_rows, seed=seed, **kwargs).to_csv(path, sep='\t', index=False)
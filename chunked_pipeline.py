@@ -0,0 +1,58 @@
+# ================================================================
+# 7. Chunked Streaming Pipeline
+# Load -> clean -> engineer -> save, one bounded-size chunk at a time
+# ================================================================
+
+import pandas as pd
+
+from .data_loading_and_exploration import RAW_DTYPES
+from .data_cleaning_and_preprocessing import clean_data
+from .data_feature_engineering import engineer_features
+from .save_transformed_data import save_data
+
+# ----------------------------------------------------------------
+# Stream the raw file through cleaning and feature engineering
+# ----------------------------------------------------------------
+def run_chunked_pipeline(input_path='data/Uber Request Data.csv',
+                         output_path='output/Uber with features.csv',
+                         chunksize=100_000):
+    """
+    Reads the raw TSV in chunks of `chunksize` rows, cleans and engineers
+    each chunk and appends it to the output CSV, so peak memory depends on
+    the chunk size rather than on the file size.
+
+    Duplicates are removed across chunk boundaries through a shared set of
+    row hashes. Clustering needs the full dataset and is not part of this
+    streaming mode.
+
+    Parameters:
+    - input_path: path to the tab-separated raw file
+    - output_path: CSV file to write (overwritten)
+    - chunksize: number of raw rows per chunk
+
+    Returns:
+    - dict with 'chunks', 'rows_in' and 'rows_out' counts
+    """
+    seen_rows = set()
+    stats = {'chunks': 0, 'rows_in': 0, 'rows_out': 0}
+
+    for chunk in pd.read_csv(input_path, sep='\t', dtype=RAW_DTYPES, chunksize=chunksize):
+        stats['rows_in'] += len(chunk)
+
+        chunk = clean_data(chunk, seen_rows=seen_rows)
+        chunk = engineer_features(chunk)
+
+        # First chunk creates the file with a header, the rest append to it
+        save_data(chunk, output_path, append=stats['chunks'] > 0)
+        stats['chunks'] += 1
+        stats['rows_out'] += len(chunk)
+
+    print(f"✅ Streamed {stats['rows_in']} rows in {stats['chunks']} chunks "
+          f"-> {stats['rows_out']} rows written")
+    return stats
+
+# ----------------------------------------------------------------
+# Optional: Run as standalone script for testing
+# ----------------------------------------------------------------
+if __name__ == "__main__":
+    run_chunked_pipeline(chunksize=1000)
@@ -0,0 +1,148 @@
+# ================================================================
+# 18. Command Line Interface
+#   python -m src clean    --input data/raw.csv --output output/clean.parquet
+#   python -m src features --input output/clean.parquet --output output/features.parquet
+#   python -m src cluster  --input output/features.parquet --output output/clustered.parquet
+#   python -m src plot     --input output/clustered.parquet --plot-dir output/plots
+#   python -m src run      --input data/raw.csv
+# ================================================================
+
+import argparse
+
+# Only the standard library is imported at module level: each subcommand
+# imports the stages it runs, so `clean` never loads plotting or
+# scikit-learn.
+
+STAGES = ['clean', 'features', 'cluster']
+
+# ----------------------------------------------------------------
+# Load the input and bring it up to the requested stage
+# ----------------------------------------------------------------
+def _stage_of(df):
+    """
+    How far an input file went through the pipeline: raw, clean,
+    features or cluster (judged from its columns).
+    """
+    if 'cluster' in df.columns:
+        return 'cluster'
+    if 'Request hour' in df.columns:
+        return 'features'
+    if str(df['Request timestamp'].dtype).startswith('datetime64'):
+        return 'clean'
+    return 'raw'
+
+def _is_raw_export(path):
+    """
+    The raw export is tab-separated; CSV files written by save_data are
+    comma-separated.
+    """
+    with open(path) as f:
+        return '\t' in f.readline()
+
+def load_input(path):
+    """
+    Reads the raw export or the saved output of any stage (.parquet,
+    .feather or a CSV written by save_data, e.g. by the `run` subcommand).
+    Saved CSVs get their column types back: timestamps are parsed and
+    feature tables are compacted again (see compact_features).
+    """
+    from .data_loading_and_exploration import load_data
+    from .save_transformed_data import get_file_format
+
+    if get_file_format(path) != 'csv' or _is_raw_export(path):
+        return load_data(path)
+
+    import pandas as pd
+
+    print("📥 Loading saved stage output...")
+    df = pd.read_csv(path)
+    df = df.assign(**{col: pd.to_datetime(df[col])
+                      for col in ('Request timestamp', 'Drop timestamp') if col in df.columns})
+    if 'Request hour' in df.columns:
+        from .data_feature_engineering import compact_features
+        return compact_features(df, verbose=False)
+    return df.astype({'Driver id': 'Int64', 'Status': 'category', 'Pickup point': 'category'})
+
+def prepare(path, until, n_clusters=5, model_path='output/cluster_model.pkl'):
+    """
+    Loads path (raw export or a saved stage output) and runs the stages
+    it still needs, up to and including `until`. Clustering uses the saved
+    model at model_path, as main() does.
+    """
+    df = load_input(path)
+    done = _stage_of(df)
+    todo = STAGES[STAGES.index(done) + 1 if done != 'raw' else 0:STAGES.index(until) + 1]
+
+    if 'clean' in todo:
+        from .data_cleaning_and_preprocessing import clean_data
+        df = clean_data(df)
+    if 'features' in todo:
+        from .data_feature_engineering import engineer_features
+        df = engineer_features(df)
+    if 'cluster' in todo:
+        from .location_clustering import add_random_coordinates, cluster_with_saved_model
+        df = cluster_with_saved_model(add_random_coordinates(df), model_path, n_clusters=n_clusters)
+    return df
+
+# ----------------------------------------------------------------
+# Subcommands
+# ----------------------------------------------------------------
+def _run_stage(args):
+    from .save_transformed_data import save_data
+
+    df = prepare(args.input, args.command, args.n_clusters, args.model_path)
+    save_data(df, args.output)
+
+def _run_plot(args):
+    from .plot_rendering import render_all_plots
+
+    df = prepare(args.input, 'cluster', args.n_clusters, args.model_path)
+    render_all_plots(df, args.plot_dir, plots=args.plots, formats=args.formats, n_jobs=args.n_jobs)
+
+def _run_all(args):
+    from .save_transformed_data import save_data
+    from .plot_rendering import render_all_plots
+
+    df = prepare(args.input, 'cluster', args.n_clusters, args.model_path)
+    save_data(df, args.output)
+    render_all_plots(df, args.plot_dir, formats=args.formats, n_jobs=args.n_jobs)
+
+def build_parser():
+    cli = argparse.ArgumentParser(prog='python -m src', description='Uber request analysis pipeline')
+    commands = cli.add_subparsers(dest='command', required=True)
+
+    defaults = {
+        'clean': 'output/Uber cleaned.parquet',
+        'features': 'output/Uber with features.parquet',
+        'cluster': 'output/Uber clustered.parquet',
+    }
+    for name, output in defaults.items():
+        command = commands.add_parser(name, help=f'run the pipeline up to the {name} stage and save it')
+        command.add_argument('--input', default='data/Uber Request Data.csv',
+                             help='raw export or the saved output of an earlier stage')
+        command.add_argument('--output', default=output)
+        command.add_argument('--n-clusters', type=int, default=5)
+        command.add_argument('--model-path', default='output/cluster_model.pkl')
+        command.set_defaults(handler=_run_stage)
+
+    for name, handler, help_text in [('plot', _run_plot, 'render the plots to image files'),
+                                     ('run', _run_all, 'run every stage, save and plot')]:
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument('--input', default='data/Uber Request Data.csv',
+                             help='raw export or the saved output of an earlier stage')
+        command.add_argument('--plot-dir', default='output/plots')
+        command.add_argument('--formats', nargs='+', default=['png'])
+        command.add_argument('--n-jobs', type=int, default=None)
+        command.add_argument('--n-clusters', type=int, default=5)
+        command.add_argument('--model-path', default='output/cluster_model.pkl')
+        command.set_defaults(handler=handler)
+    commands.choices['plot'].add_argument('--plots', nargs='+', help='plot names (default: all)')
+    commands.choices['run'].add_argument('--output', default='output/Uber with features.csv')
+    return cli
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.handler(args)
+
+if __name__ == "__main__":
+    main()
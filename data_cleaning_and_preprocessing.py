@@ -5,6 +5,15 @@
 import pandas as pd
 from dateutil import parser
 
+# ----------------------------------------------------------------
+# Timestamp layouts found in the raw export
+# e.g. '13-07-2016 08:33:16', '11/7/2016 11:51', '11/7/2016 9:05'
+# ----------------------------------------------------------------
+DATE_FORMATS = {
+    '%d-%m-%Y %H:%M:%S': r'^\d{1,2}-\d{1,2}-\d{4} \d{1,2}:\d{2}:\d{2}$',
+    '%d/%m/%Y %H:%M': r'^\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}$',
+}
+
 # ----------------------------------------------------------------
 # Function to safely parse date strings
 # ----------------------------------------------------------------
@@ -15,53 +24,137 @@ def smart_date_parser(date_str):
     """
     try:
         return parser.parse(str(date_str), dayfirst=True)
-    except:
+    except (ValueError, TypeError, OverflowError):
         return pd.NaT
 
+# ----------------------------------------------------------------
+# Vectorized parsing of one timestamp column
+# ----------------------------------------------------------------
+def parse_timestamps(series, formats=DATE_FORMATS):
+    """
+    Parses a column of timestamp strings by grouping the cells per layout
+    and running one vectorized pd.to_datetime call per layout.
+    Cells matching no known layout fall back to smart_date_parser.
+
+    Parameters:
+    - series: Series of raw timestamp strings
+    - formats: dict mapping strptime format -> regex detecting that layout
+
+    Returns:
+    - parsed (Series): datetime64 values (NaT where parsing failed)
+    - stats (dict): hit count per format, 'fallback' and 'unparseable' counts
+    """
+    text = series.astype('string').str.strip()
+    # Microsecond unit, like pd.to_datetime: a year typo such as 3016 is
+    # out of range for nanoseconds and would abort the whole column
+    parsed = pd.Series(pd.NaT, index=series.index, dtype='datetime64[us]')
+    remaining = text.notna().to_numpy(dtype=bool, copy=True)
+    stats = {}
+
+    for fmt, pattern in formats.items():
+        mask = remaining & text.str.match(pattern, na=False).to_numpy(dtype=bool)
+        values = pd.to_datetime(text[mask], format=fmt, errors='coerce')
+        parsed[mask] = values
+        hits = mask.copy()
+        hits[mask] = values.notna().to_numpy()
+        stats[fmt] = int(hits.sum())
+        remaining &= ~hits
+
+    # Leftover cells go through the slow, flexible dateutil path
+    if remaining.any():
+        leftovers = pd.to_datetime(text[remaining].map(smart_date_parser))
+        parsed[remaining] = leftovers
+        stats['fallback'] = int(leftovers.notna().sum())
+        stats['unparseable'] = int(leftovers.isna().sum())
+    else:
+        stats['fallback'] = 0
+        stats['unparseable'] = 0
+
+    return parsed, stats
+
 # ----------------------------------------------------------------
 # Function to apply datetime parsing to both relevant columns
 # ----------------------------------------------------------------
-def parse_dates(df):
+def parse_dates(df, verbose=True):
     """
-    Applies smart_date_parser to the 'Request timestamp' and 'Drop timestamp' columns.
+    Parses the 'Request timestamp' and 'Drop timestamp' columns.
+    Per-column parse statistics are kept in df.attrs['date_parse_stats'].
+    Columns that are already datetime64 (parsed upstream) are kept as is.
+
+    Returns:
+    - a new DataFrame; df itself is left untouched
     """
-    df['Request timestamp'] = df['Request timestamp'].apply(smart_date_parser)
-    df['Drop timestamp'] = df['Drop timestamp'].apply(smart_date_parser)
+    parsed, all_stats = {}, {}
+    for col in ['Request timestamp', 'Drop timestamp']:
+        if pd.api.types.is_datetime64_any_dtype(df[col]):
+            continue
+        parsed[col], all_stats[col] = parse_timestamps(df[col])
+        if verbose:
+            print(f"🗓️ Parsed '{col}':", all_stats[col])
+    df = df.assign(**parsed)
+    df.attrs['date_parse_stats'] = all_stats
     return df
 
+# ----------------------------------------------------------------
+# Function to tidy a text column (strip + title-case)
+# ----------------------------------------------------------------
+def clean_text(series):
+    """
+    Strips whitespace and title-cases a text column. Categorical columns
+    are cleaned once per category and stay categorical.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = series.cat.categories
+        cleaned = dict(zip(categories, categories.str.strip().str.title()))
+        return series.map(cleaned).astype('category')
+    return series.str.strip().str.title()
+
 # ----------------------------------------------------------------
 # Main data cleaning function
 # ----------------------------------------------------------------
-def clean_data(df):
+def clean_data(df, seen_rows=None):
     """
     Cleans the Uber dataset:
     - Parses dates
     - Removes duplicates
     - Handles missing driver IDs
     - Cleans text values (strip + title-case)
-    - Filters invalid IDs
+    - Filters invalid IDs and unreadable request timestamps
+
+    All row filters are combined into one mask applied once, and the
+    cleaned columns are set in a single assign, so the rows are copied at
+    most once and the caller's frame is never modified.
+
+    When the data arrives in chunks, pass the same set as seen_rows for
+    every chunk: rows already seen in an earlier chunk are dropped too.
     """
     print("🧹 Cleaning data...")
 
     # Apply date parsing
     df = parse_dates(df)
 
-    # Drop duplicate rows
-    df.drop_duplicates(inplace=True)
+    # Rows to keep: no duplicates, valid IDs, a readable request time
+    driver_id = df['Driver id'].fillna(0)
+    keep = (~df.duplicated()
+            & (df['Request id'] > 0)
+            & (driver_id >= 0)
+            & df['Request timestamp'].notna())
 
-    # Handle missing Driver IDs
-    df['Driver id'] = df['Driver id'].fillna(0)
-    df['Driver id'] = df['Driver id'].astype('Int64')
+    # Drop rows already seen in previous chunks (keyed on a row hash)
+    if seen_rows is not None:
+        row_hashes = pd.util.hash_pandas_object(df, index=False)
+        keep &= ~row_hashes.isin(seen_rows)
+        seen_rows.update(row_hashes[keep].tolist())
 
-    # Clean text fields
-    df['Status'] = df['Status'].str.strip().str.title()
-    df['Pickup point'] = df['Pickup point'].str.strip().str.title()
+    if not keep.all():
+        df, driver_id = df[keep], driver_id[keep]
 
-    # Remove rows with invalid IDs
-    df = df[df['Request id'] > 0]
-    df = df[df['Driver id'] >= 0]
-
-    return df
+    # Missing Driver IDs become 0; text fields are stripped and title-cased
+    return df.assign(**{
+        'Driver id': driver_id.astype('Int64'),
+        'Status': clean_text(df['Status']),
+        'Pickup point': clean_text(df['Pickup point']),
+    })
 
 # ----------------------------------------------------------------
 # Optional: Run as standalone script for testing
@@ -3,6 +3,7 @@
 # Extracting time-based and derived features from timestamps
 # ================================================================
 
+import numpy as np
 import pandas as pd
 
 # ----------------------------------------------------------------
@@ -24,63 +25,204 @@ def get_time_period(hour):
     else:
         return 'Night'
 
+# ----------------------------------------------------------------
+# Vectorized version of get_time_period for a whole column
+# ----------------------------------------------------------------
+def get_time_periods(hours):
+    """
+    Classifies a Series of hours into Morning, Afternoon, Evening or Night
+    in one pass over the underlying array (same rules as get_time_period).
+    Missing hours stay missing.
+    """
+    h = hours.to_numpy(dtype='float64', na_value=np.nan)
+    periods = np.select(
+        [np.isnan(h), (h >= 5) & (h < 12), (h >= 12) & (h < 17), (h >= 17) & (h < 21)],
+        [None, 'Morning', 'Afternoon', 'Evening'],
+        default='Night'
+    )
+    return pd.Series(periods, index=hours.index).astype('category')
+
+# ----------------------------------------------------------------
+# Vectorized equivalent of Python's built-in round()
+# ----------------------------------------------------------------
+def _round_like_python(values, ndigits=1):
+    """
+    Rounds an array of floats exactly like Python's round(x, ndigits):
+    decided on the exact binary value, ties to even. np.round works on
+    x * 10**ndigits and disagrees on values such as 57.55 (-> 57.6).
+    """
+    x = np.asarray(values, dtype='float64')
+    scale = 10.0 ** ndigits
+    k = np.floor(x * scale)
+
+    # Split x into high/low halves so x * scale is evaluated exactly (Dekker)
+    c = 134217729.0 * x
+    x_hi = c - (c - x)
+    x_lo = x - x_hi
+    diff = (x_hi * scale - (k + 0.5)) + x_lo * scale
+
+    up = (diff > 0) | ((diff == 0) & (np.mod(k, 2) == 1))
+    return (k + up) / scale
+
+# ----------------------------------------------------------------
+# Trip duration as readable text (e.g. "01:09:00")
+# ----------------------------------------------------------------
+def trip_duration_text(df):
+    """
+    Formats Drop - Request timestamp as text, "00:00:00" when missing.
+    Compact frames do not store this column; it is derived on demand.
+    """
+    duration = df['Drop timestamp'] - df['Request timestamp']
+
+    # Each distinct duration is formatted once; missing ones get code -1,
+    # which picks the trailing "00:00:00" label
+    codes, uniques = pd.factorize(duration)
+    labels = np.append(uniques.astype(str).str.replace("0 days ", "", regex=False), "00:00:00")
+    return pd.Series(labels[codes], index=df.index)
+
+def with_trip_duration_text(df):
+    """
+    Returns a copy of df with the 'Trip duration' text column added after
+    'Time slot' (where the full feature table has it), if it is missing.
+    """
+    if 'Trip duration' in df.columns:
+        return df
+    position = df.columns.get_loc('Time slot') + 1 if 'Time slot' in df.columns else len(df.columns)
+    df = df.copy()
+    df.insert(position, 'Trip duration', trip_duration_text(df))
+    return df
+
+# ----------------------------------------------------------------
+# Compact storage of the engineered frame
+# ----------------------------------------------------------------
+# Columns added by engineer_features, in order
+FEATURE_COLUMNS = ['Request hour', 'Request day', 'Time slot', 'Trip duration', 'Is Completed',
+                   'Driver Available', 'Request Date', 'Trip Duration Mins']
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+CATEGORY_COLUMNS = {'Status': None, 'Pickup point': None, 'Request day': WEEKDAYS, 'Time slot': None}
+UNSIGNED_COLUMNS = ['Request id', 'Driver id', 'Request hour', 'cluster']
+FLOAT32_COLUMNS = ['Trip Duration Mins', 'Latitude', 'Longitude']
+
+def memory_report(before, after):
+    """
+    Per-column memory (bytes, deep) of two versions of a frame.
+    """
+    report = pd.DataFrame({
+        'before': before.memory_usage(deep=True, index=False),
+        'after': after.memory_usage(deep=True, index=False),
+    })
+    report.loc['Total'] = report.sum()
+    report['ratio'] = (report['before'] / report['after']).round(1)
+    return report
+
+def compact_features(df, verbose=True):
+    """
+    Shrinks the engineered frame:
+    - text columns -> category ('Request day' in weekday order)
+    - ids, hour and cluster -> smallest unsigned int (when no missing values)
+    - durations and coordinates -> float32
+    - 'Request Date' -> datetime64 (midnight) instead of Python date objects
+    - 'Trip duration' text is dropped (see trip_duration_text)
+
+    Returns:
+    - the compacted DataFrame (a new object; df is left untouched)
+    """
+    columns = {}
+    for col, categories in CATEGORY_COLUMNS.items():
+        if col in df.columns:
+            columns[col] = df[col].astype(pd.CategoricalDtype(categories))
+    for col in UNSIGNED_COLUMNS:
+        if col in df.columns and df[col].notna().all() and (df[col] >= 0).all():
+            columns[col] = pd.to_numeric(df[col].to_numpy(dtype='int64'), downcast='unsigned')
+    for col in FLOAT32_COLUMNS:
+        if col in df.columns:
+            columns[col] = df[col].astype('float32')
+    if 'Request Date' in df.columns:
+        columns['Request Date'] = pd.to_datetime(df['Request Date'])
+
+    compact = df.assign(**columns).drop(columns=['Trip duration'], errors='ignore')
+    if verbose:
+        report = memory_report(df, compact)
+        print(f"🗜️ Compacted features: {report.loc['Total', 'before'] / 1e6:.1f} MB -> "
+              f"{report.loc['Total', 'after'] / 1e6:.1f} MB")
+    return compact
+
 # ----------------------------------------------------------------
 # Main feature engineering function
 # ----------------------------------------------------------------
-def engineer_features(df):
+def engineer_features(df, compact=True, features=None):
     """
     Adds new features to the dataframe:
     - Request hour, Request day (weekday)
     - Time slot (Morning, Evening...)
     - Trip duration (text + numeric in minutes)
     - Driver availability, Trip completion, Request date
+
+    With compact=True (default) the result goes through compact_features:
+    smaller dtypes and no stored 'Trip duration' text.
+
+    features limits the work to the listed FEATURE_COLUMNS (default: all),
+    e.g. when a caller only needs 'Request hour'.
+
+    The new columns are built first and added in one assign; the caller's
+    frame is never modified.
     """
     print("🧠 Feature engineering...")
+    wanted = set(FEATURE_COLUMNS if features is None else features)
+
+    # Rows without a request time are dropped (clean_data already does it)
+    valid = df['Request timestamp'].notna()
+    if not valid.all():
+        df = df[valid]
+    requested = df['Request timestamp']
+    new_columns = {}
 
     # Extract hour and day from the request timestamp
-    df = df[df['Request timestamp'].notna()]
-    df['Request hour'] = df['Request timestamp'].dt.hour         
-    df['Request day'] = df['Request timestamp'].dt.dayofweek 
-    df['Request hour'] = df['Request hour'].astype('Int64')
-    df['Request day'] = df['Request day'].astype('Int64')
+    hour = requested.dt.hour.astype('Int64')
+    if 'Request hour' in wanted:
+        new_columns['Request hour'] = hour
 
     # Map numeric day to weekday name
     weekday_map = {
         0: 'Monday', 1: 'Tuesday', 2: 'Wednesday',
         3: 'Thursday', 4: 'Friday', 5: 'Saturday', 6: 'Sunday'
     }
-    df['Request day'] = df['Request day'].map(weekday_map)
+    if 'Request day' in wanted:
+        new_columns['Request day'] = requested.dt.dayofweek.astype('Int64').map(weekday_map)
 
     # Assign time slot (e.g. Morning, Afternoon)
-    df['Time slot'] = df['Request hour'].apply(get_time_period)
-    df['Time slot'] = df['Time slot'].astype('category')
-    
-    # Display the Extracted Time Features
-    cols_to_show = ['Request timestamp', 'Request hour', 'Request day',  
-                    'Time slot']
-    existing_cols = [col for col in cols_to_show if col in df.columns]
-    print(df[existing_cols].head())
-
-    # Calculate trip duration as timedelta
-    df['Trip duration'] = df['Drop timestamp'] - df['Request timestamp']
-    
+    if 'Time slot' in wanted:
+        new_columns['Time slot'] = get_time_periods(hour)
+
     # Convert timedelta to string just for readability
-    df['Trip duration'] = df['Trip duration'].apply(
-        lambda x: str(x).replace("0 days ", "") if pd.notna(x) else "00:00:00"
-    )
-    
+    if not compact and 'Trip duration' in wanted:
+        new_columns['Trip duration'] = trip_duration_text(df)
+
     # Binary features
-    df['Is Completed'] = df['Status'] == 'Trip Completed'
-    df['Driver Available'] = df['Driver id'].apply(lambda x: True if pd.notna(x) and x > 0 else False)
-
-    # Extract just the date
-    df['Request Date'] = df['Request timestamp'].dt.date
-    
-    # Calculate duration in minutes from timedelta
-    df['Trip Duration Mins'] = df['Trip duration'].apply(
-    lambda x: round(pd.Timedelta(x).total_seconds() / 60, 1) if pd.notna(x) else 0
-    )
+    if 'Is Completed' in wanted:
+        new_columns['Is Completed'] = df['Status'] == 'Trip Completed'
+    if 'Driver Available' in wanted:
+        new_columns['Driver Available'] = (df['Driver id'] > 0).fillna(False).astype(bool)
+
+    # Extract just the date (as midnight timestamps in compact mode)
+    if 'Request Date' in wanted:
+        new_columns['Request Date'] = requested.dt.normalize() if compact else requested.dt.date
+
+    # Calculate duration in minutes straight from the timedelta
+    if 'Trip Duration Mins' in wanted:
+        duration = df['Drop timestamp'] - requested
+        new_columns['Trip Duration Mins'] = pd.Series(
+            _round_like_python(duration.dt.total_seconds() / 60), index=df.index
+        ).fillna(0)
+
+    df = df.assign(**new_columns)
+
+    # Display the Extracted Time Features
+    cols_to_show = ['Request timestamp', 'Request hour', 'Request day', 'Time slot']
+    print(df[[col for col in cols_to_show if col in df.columns]].head())
 
+    if compact:
+        df = compact_features(df)
     return df
 
 # ----------------------------------------------------------------
@@ -93,4 +235,5 @@ if __name__ == "__main__":
     df = clean_data(df)
 
     df = engineer_features(df)
+    df['Trip duration'] = trip_duration_text(df)
     print(df[['Request timestamp', 'Drop timestamp', 'Trip duration', 'Trip Duration Mins']].head())
\ No newline at end of file
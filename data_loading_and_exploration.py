@@ -2,22 +2,116 @@
 # 1. Data Loading and Basic Exploration
 # ================================================================
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 
-def load_data(path='data/Uber Request Data.csv'):
+from .save_transformed_data import get_file_format
+
+# ----------------------------------------------------------------
+# Column types of the raw request export, applied at read time
+# ----------------------------------------------------------------
+RAW_DTYPES = {
+    'Request id': 'int64',
+    'Pickup point': 'category',
+    'Driver id': 'Int64',
+    'Status': 'category',
+    'Request timestamp': str,
+    'Drop timestamp': str,
+}
+
+def load_data(path='data/Uber Request Data.csv', columns=None, explore=False):
     """
-    Loads the Uber dataset and displays initial exploration + visualizations.
-    
+    Loads the Uber dataset. The raw export is read with explicit dtypes
+    (categorical 'Status' and 'Pickup point').
+
+    Parquet/Feather files (e.g. a saved feature table) are read with their
+    stored column types and returned directly, without the exploration.
+
     Parameters:
-    - path (str): Path to the CSV file.
+    - path (str): Path to the CSV file, or to a .parquet/.feather file.
+    - columns (list): Optional subset of columns to read.
+    - explore (bool): Also print the exploration report and show its plots
+      (see explore_data).
 
     Returns:
     - df (DataFrame): Loaded dataset.
     """
     print("📥 Loading dataset...")
-    df = pd.read_csv(path, sep='\t')
+    file_format = get_file_format(path)
+    if file_format == 'parquet':
+        return pd.read_parquet(path, columns=columns)
+    if file_format == 'feather':
+        return pd.read_feather(path, columns=columns)
+
+    df = pd.read_csv(path, sep='\t', usecols=columns, dtype=RAW_DTYPES)
+
+    if explore:
+        explore_data(df)
+
+    return df
+
+# ----------------------------------------------------------------
+# Exploration statistics, one pass over each column
+# ----------------------------------------------------------------
+def build_exploration_report(df):
+    """
+    Computes the exploration statistics of a DataFrame. Each column is
+    factorized once and count, missing, unique, top/freq (plus the numeric
+    summary for numeric columns) are all taken from that single pass.
+
+    Returns:
+    - dict with 'summary' (one row per column), 'shape' and, when both
+      columns exist, 'status_by_pickup' (Status x Pickup point counts)
+    """
+    rows = {}
+    for col in df.columns:
+        series = df[col]
+        codes, uniques = pd.factorize(series)
+        present = codes[codes >= 0]
+        freq = np.bincount(present, minlength=len(uniques))
+
+        stats = {
+            'dtype': str(series.dtype),
+            'count': len(present),
+            'missing': len(codes) - len(present),
+            'unique': len(uniques),
+            'top': uniques[freq.argmax()] if len(uniques) else None,
+            'freq': freq.max() if len(uniques) else 0,
+        }
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            values = series.to_numpy(dtype='float64', na_value=np.nan)
+            values = values[~np.isnan(values)]
+            if len(values):
+                q25, q50, q75 = np.percentile(values, [25, 50, 75])
+                stats.update({
+                    'mean': values.mean(),
+                    'std': values.std(ddof=1) if len(values) > 1 else np.nan,
+                    'min': values.min(), '25%': q25, '50%': q50, '75%': q75,
+                    'max': values.max(),
+                })
+        rows[col] = stats
+
+    report = {'shape': df.shape, 'summary': pd.DataFrame.from_dict(rows, orient='index')}
+    if {'Status', 'Pickup point'} <= set(df.columns):
+        report['status_by_pickup'] = (
+            df.groupby(['Status', 'Pickup point'], observed=True).size()
+            .unstack(fill_value=0)
+        )
+    return report
+
+# ----------------------------------------------------------------
+# Opt-in exploration step (prints the report and shows the plots)
+# ----------------------------------------------------------------
+def explore_data(df, show_plots=True):
+    """
+    Displays the initial exploration of the dataset: preview, a per-column
+    summary (types, missing and unique values, numeric description) and
+    the pickup point / status count plots, drawn from pre-computed counts.
+
+    Returns:
+    - report (dict): see build_exploration_report
+    """
+    report = build_exploration_report(df)
 
     # ----------------------------
     # Basic Data Preview
@@ -26,29 +120,28 @@ def load_data(path='data/Uber Request Data.csv'):
     print(df.head())
     print("\n🔍 Last 5 rows:")
     print(df.tail())
-    print(f"\n📐 Shape: {df.shape}")
-    print("\n🧠 Info:")
-    df.info()
-    print("\n📊 Numeric Description:")
-    print(df.describe())
-    print("\n📊 Full Description (including categorical):")
-    print(df.describe(include='all'))
+    print(f"\n📐 Shape: {report['shape']}")
 
     # ----------------------------
-    # Missing and Unique Values
+    # Types, Missing and Unique Values, Description
     # ----------------------------
-    print("\n❗ Missing values per column:")
-    print(df.isnull().sum())
-    print("\n🔢 Unique values per column:")
-    print(df.nunique())
+    print("\n📊 Column Summary:")
+    print(report['summary'].to_string())
 
-    # ----------------------------
-    # Always Show Initial Visualizations
-    # ----------------------------
+    if not show_plots or 'status_by_pickup' not in report:
+        return report
+
+    # Plotting libraries are imported here so load_data stays cheap to import
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    counts = report['status_by_pickup']
+    long_counts = counts.stack().rename('Count').reset_index()
 
     # 1. Pickup point distribution
     plt.figure(figsize=(8, 5))
-    sns.countplot(x='Pickup point', data=df)
+    pickup_counts = counts.sum(axis=0)
+    sns.barplot(x=pickup_counts.index.astype(str), y=pickup_counts.values)
     plt.title('Distribution of Pickup Points')
     plt.xlabel('Pickup Point')
     plt.ylabel('Count')
@@ -56,7 +149,8 @@ def load_data(path='data/Uber Request Data.csv'):
 
     # 2. Trip status distribution
     plt.figure(figsize=(8, 5))
-    sns.countplot(x='Status', data=df)
+    status_counts = counts.sum(axis=1)
+    sns.barplot(x=status_counts.index.astype(str), y=status_counts.values)
     plt.title('Distribution of Trip Status')
     plt.xlabel('Trip Status')
     plt.ylabel('Count')
@@ -64,14 +158,14 @@ def load_data(path='data/Uber Request Data.csv'):
 
     # 3. Status broken down by pickup point
     plt.figure(figsize=(8, 5))
-    sns.countplot(x="Status", hue="Pickup point", data=df)
+    sns.barplot(x='Status', y='Count', hue='Pickup point', data=long_counts)
     plt.title("Trip Status by Pickup Point")
     plt.xlabel("Trip Status")
     plt.ylabel("Count")
     plt.show()
 
-    return df
+    return report
 
 # Optional test run
 if __name__ == "__main__":
-    df = load_data()
+    df = load_data(explore=True)
@@ -3,199 +3,319 @@
 # Create charts to explore patterns and extract insights
 # ================================================================
 
+import numpy as np
 import seaborn as sns
 import matplotlib.pyplot as plt
+from matplotlib.colors import LogNorm
+from matplotlib.patches import Patch
+
+from .driver_stats import top_drivers
+from .summary_cube import cube_counts
+
+# ----------------------------------------------------------------
+# Every plot draws on an explicit Axes. Without one, a new figure is
+# created and shown interactively; with one, the caller owns the figure
+# (e.g. to save it to a file, see plot_rendering.py).
+#
+# Count plots accept either the row-level frame or the summary cube
+# (summary_cube.build_request_cube) and draw from aggregated counts.
+# ----------------------------------------------------------------
+def _get_axes(ax):
+    if ax is None:
+        return plt.subplots()[1], True
+    return ax, False
+
+def _finish(show):
+    if show:
+        plt.show()
+
+# ----------------------------------------------------------------
+# Point plots switch to density rendering for large frames: the points
+# are binned into a fixed 2D grid and drawn as one raster image, so the
+# drawing time and file size do not grow with the number of rows.
+# ----------------------------------------------------------------
+DENSITY_THRESHOLD = 50_000
+
+def _use_density(df, mode):
+    if mode not in ('auto', 'scatter', 'density'):
+        raise ValueError(f"mode must be 'auto', 'scatter' or 'density', got {mode!r}")
+    return mode == 'density' or (mode == 'auto' and len(df) > DENSITY_THRESHOLD)
+
+def density_grid(x, y, bins=200, extent=None, groups=None):
+    """
+    Counts points per cell of a regular grid in one vectorized pass
+    (optionally per group, e.g. per cluster).
+
+    Parameters:
+    - x, y: coordinate arrays (non-finite points are skipped)
+    - bins: number of cells, or (x cells, y cells)
+    - extent: (xmin, xmax, ymin, ymax); default: the data range
+    - groups: optional array of group labels, one per point
+
+    Returns:
+    - counts: array of shape (n_groups, y cells, x cells)
+    - extent: the grid bounds used
+    - labels: the group label of each counts layer
+    """
+    x, y = np.asarray(x, dtype='float64'), np.asarray(y, dtype='float64')
+    keep = np.isfinite(x) & np.isfinite(y)
+    nx, ny = (bins, bins) if np.isscalar(bins) else bins
+    if extent is None:
+        extent = (x[keep].min(), x[keep].max(), y[keep].min(), y[keep].max())
+    xmin, xmax, ymin, ymax = extent
+    keep &= (x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax)
+
+    # Cell index of every point; the upper bounds fall into the last cell
+    ix = np.minimum(((x[keep] - xmin) / ((xmax - xmin) or 1) * nx).astype(np.intp), nx - 1)
+    iy = np.minimum(((y[keep] - ymin) / ((ymax - ymin) or 1) * ny).astype(np.intp), ny - 1)
+    if groups is None:
+        labels, codes = np.array([None]), np.zeros(len(ix), dtype=np.intp)
+    else:
+        labels, codes = np.unique(np.asarray(groups)[keep], return_inverse=True)
+
+    cells = nx * ny
+    counts = np.bincount(codes * cells + iy * nx + ix, minlength=len(labels) * cells)
+    return counts.reshape(len(labels), ny, nx), extent, labels
 
 # ----------------------------------------------------------------
 # Distribution of Pickup Points
 # ----------------------------------------------------------------
-def plot_pickup_point_distribution(df):
+def plot_pickup_point_distribution(df, ax=None):
     """
     Bar chart showing the count of pickup points (City vs Airport)
     """
-    sns.countplot(x='Pickup point', data=df)
-    plt.title('Distribution of Pickup Points')
-    plt.xlabel('Pickup Point')
-    plt.ylabel('Count')
-    plt.show()
+    ax, show = _get_axes(ax)
+    counts = cube_counts(df, 'Pickup point')
+    sns.barplot(x=counts.index.astype(str), y=counts.values, ax=ax)
+    ax.set_title('Distribution of Pickup Points')
+    ax.set_xlabel('Pickup Point')
+    ax.set_ylabel('Count')
+    _finish(show)
 
 # ----------------------------------------------------------------
 # Distribution of Trip Status
 # ----------------------------------------------------------------
-def plot_trip_status(df):
+def plot_trip_status(df, ax=None):
     """
     Bar chart showing the status of trips (Completed, Cancelled, etc.)
     """
-    sns.countplot(x='Status', data=df)
-    plt.title('Distribution of Trip Status')
-    plt.xlabel('Status')
-    plt.ylabel('Count')
-    plt.show()
+    ax, show = _get_axes(ax)
+    counts = cube_counts(df, 'Status')
+    sns.barplot(x=counts.index.astype(str), y=counts.values, ax=ax)
+    ax.set_title('Distribution of Trip Status')
+    ax.set_xlabel('Status')
+    ax.set_ylabel('Count')
+    _finish(show)
 
 # ----------------------------------------------------------------
 # Trip Status broken down by Pickup Point
 # ----------------------------------------------------------------
-def plot_status_by_pickup_point(df):
+def plot_status_by_pickup_point(df, ax=None):
     """
     Stacked bar chart: Status by Pickup Point
     """
-    sns.countplot(x='Status', hue='Pickup point', data=df)
-    plt.title('Trip Status by Pickup Point')
-    plt.xlabel('Trip Status')
-    plt.ylabel('Count')
-    plt.show()
+    ax, show = _get_axes(ax)
+    counts = cube_counts(df, ['Status', 'Pickup point']).reset_index()
+    sns.barplot(x='Status', y='Count', hue='Pickup point', data=counts, ax=ax)
+    ax.set_title('Trip Status by Pickup Point')
+    ax.set_xlabel('Trip Status')
+    ax.set_ylabel('Count')
+    _finish(show)
 
 # ----------------------------------------------------------------
 # Daily Request Count by Day of the Week
 # ----------------------------------------------------------------
-def plot_daily_requests(df):
+def plot_daily_requests(df, ax=None):
     """
     Shows total number of requests for each day of the week
     """
-    sns.countplot(x='Request day', data=df)
-    plt.title('Number of Daily Requests by Day')
-    plt.xlabel('Day of the Week')
-    plt.ylabel('Number of Requests')
-    plt.show()
+    ax, show = _get_axes(ax)
+    counts = cube_counts(df, 'Request day')
+    sns.barplot(x=counts.index.astype(str), y=counts.values, ax=ax)
+    ax.set_title('Number of Daily Requests by Day')
+    ax.set_xlabel('Day of the Week')
+    ax.set_ylabel('Number of Requests')
+    _finish(show)
 
 # ----------------------------------------------------------------
 # Requests per Time Slot
 # ----------------------------------------------------------------
-def plot_time_slot_distribution(df):
+def plot_time_slot_distribution(df, ax=None):
     """
     Count of requests per time period (Morning, Afternoon, etc.)
     """
-    sns.countplot(x='Time slot', data=df, palette='crest')
-    plt.title('Requests per Time Slot')
-    plt.xlabel('Time Slot')
-    plt.ylabel('Number of Requests')
-    plt.show()
+    ax, show = _get_axes(ax)
+    counts = cube_counts(df, 'Time slot')
+    sns.barplot(x=counts.index.astype(str), y=counts.values, palette='crest', ax=ax)
+    ax.set_title('Requests per Time Slot')
+    ax.set_xlabel('Time Slot')
+    ax.set_ylabel('Number of Requests')
+    _finish(show)
 
 # ----------------------------------------------------------------
 # Requests per Hour
 # ----------------------------------------------------------------
-def plot_hourly_requests(df):
+def plot_hourly_requests(df, ax=None):
     """
     Count of requests by hour of the day
     """
-    sns.countplot(x='Request hour', data=df, palette='crest')
-    plt.title('Requests per Hour')
-    plt.xlabel('Hour of the Day')
-    plt.ylabel('Number of Requests')
-    plt.show()
+    ax, show = _get_axes(ax)
+    counts = cube_counts(df, 'Request hour')
+    sns.barplot(x=counts.index.astype(str), y=counts.values, palette='crest', ax=ax)
+    ax.set_title('Requests per Hour')
+    ax.set_xlabel('Hour of the Day')
+    ax.set_ylabel('Number of Requests')
+    _finish(show)
 
 # ----------------------------------------------------------------
 # Heatmap of Requests by Hour and Day
 # ----------------------------------------------------------------
-def plot_request_heatmap(df):
+def plot_request_heatmap(df, ax=None):
     """
     Heatmap showing request density by hour and weekday
     """
-    pivot_table = df.pivot_table(values='Request id', index='Request hour', columns='Request day', aggfunc='count')
-    sns.heatmap(pivot_table, cmap='Spectral')
-    plt.title('Requests by Hour and Day')
-    plt.xlabel('Day of the Week')
-    plt.ylabel('Hour of the Day')
-    plt.show()
+    ax, show = _get_axes(ax)
+    pivot_table = cube_counts(df, ['Request hour', 'Request day']).unstack()
+    sns.heatmap(pivot_table, cmap='Spectral', ax=ax)
+    ax.set_title('Requests by Hour and Day')
+    ax.set_xlabel('Day of the Week')
+    ax.set_ylabel('Hour of the Day')
+    _finish(show)
 
 # ----------------------------------------------------------------
 # Trip Duration Distribution per Hour (Boxplot)
 # ----------------------------------------------------------------
-def plot_trip_duration_boxplot(df):
+def plot_trip_duration_boxplot(df, ax=None):
     """
     Boxplot showing the variation of trip duration over different hours
     """
+    ax, show = _get_axes(ax)
     df_filtered = df[df['Trip Duration Mins'] > 0]
-    sns.boxplot(x='Request hour', y='Trip Duration Mins', data=df_filtered, palette='rainbow')
-    plt.title('Trip Duration Distribution by Request Hour')
-    plt.xlabel('Request Hour')
-    plt.ylabel('Trip Duration (mins)')
-    plt.ylim(0, 100)
-    plt.show()
+    sns.boxplot(x='Request hour', y='Trip Duration Mins', data=df_filtered, palette='rainbow', ax=ax)
+    ax.set_title('Trip Duration Distribution by Request Hour')
+    ax.set_xlabel('Request Hour')
+    ax.set_ylabel('Trip Duration (mins)')
+    ax.set_ylim(0, 100)
+    _finish(show)
 
 # ----------------------------------------------------------------
 # Trip Duration vs. Request Hour (Scatter plot)
 # ----------------------------------------------------------------
-def plot_trip_duration_scatter(df):
+def plot_trip_duration_scatter(df, ax=None, mode='auto', bins=(24, 90)):
     """
-    Scatter plot showing trip duration across request hours
+    Scatter plot showing trip duration across request hours.
+    With mode='density' (automatic above DENSITY_THRESHOLD rows) the
+    trips are counted per (hour, duration) cell and drawn as a heatmap.
     """
+    ax, show = _get_axes(ax)
     # Remove outliers before plotting
-    df_filtered = df[(df['Trip Duration Mins'] <= 180) & (df['Trip Duration Mins'] > 0)]
+    duration = df['Trip Duration Mins']
+    keep = (duration <= 180) & (duration > 0)
 
-    # Scatter plot
-    sns.scatterplot(x='Request hour', y='Trip Duration Mins', data=df_filtered)
-    plt.xlabel('Request Hour')
-    plt.ylabel('Trip Duration (mins)')
-    plt.title('Trip Duration vs. Request Hour')
-    plt.show()
+    if _use_density(df, mode):
+        counts, extent, _ = density_grid(df['Request hour'].to_numpy(dtype='float64')[keep],
+                                         duration.to_numpy(dtype='float64')[keep],
+                                         bins, extent=(-0.5, 23.5, 0, 180))
+        image = ax.imshow(np.ma.masked_equal(counts[0], 0), extent=extent, origin='lower',
+                          aspect='auto', interpolation='nearest', cmap='viridis', norm=LogNorm())
+        ax.figure.colorbar(image, ax=ax, label='Trips')
+    else:
+        # Scatter plot
+        sns.scatterplot(x='Request hour', y='Trip Duration Mins', data=df[keep], ax=ax)
+    ax.set_xlabel('Request Hour')
+    ax.set_ylabel('Trip Duration (mins)')
+    ax.set_title('Trip Duration vs. Request Hour')
+    _finish(show)
 
 
 # ----------------------------------------------------------------
 # Top 10 Drivers with Most Trips
 # ----------------------------------------------------------------
-def plot_top_drivers(df):
+def plot_top_drivers(df, ax=None):
     """
     Bar chart showing top 10 drivers by number of trips
+    (df can be the driver statistics from build_driver_stats)
     """
-    top_drivers = df[df['Driver id'] > 0].groupby('Driver id').size().sort_values(ascending=False).head(10)
-    sns.barplot(x=top_drivers.index.astype(str), y=top_drivers.values, palette='viridis')
-    plt.title('Top 10 Drivers by Number of Trips')
-    plt.xlabel('Driver ID')
-    plt.ylabel('Number of Trips')
-    plt.xticks(rotation=45)
-    plt.show()
+    ax, show = _get_axes(ax)
+    top = top_drivers(df, n=10)['Trips']
+    sns.barplot(x=top.index.astype(str), y=top.values, palette='viridis', ax=ax)
+    ax.set_title('Top 10 Drivers by Number of Trips')
+    ax.set_xlabel('Driver ID')
+    ax.set_ylabel('Number of Trips')
+    ax.tick_params(axis='x', rotation=45)
+    _finish(show)
 
 # ----------------------------------------------------------------
 # Driver Availability by Day of Week
 # ----------------------------------------------------------------
-def plot_driver_availability_by_day(df):
+def plot_driver_availability_by_day(df, ax=None):
     """
     Stacked bar showing driver availability broken down by day
     """
-    sns.countplot(x='Driver Available', hue='Request day', data=df, palette='rainbow')
-    plt.title('Driver Availability by Day of Week')
-    plt.xlabel('Driver Available?')
-    plt.ylabel('Number of Requests')
-    plt.show()
+    ax, show = _get_axes(ax)
+    counts = cube_counts(df, ['Driver Available', 'Request day']).reset_index()
+    sns.barplot(x='Driver Available', y='Count', hue='Request day', data=counts, palette='rainbow', ax=ax)
+    ax.set_title('Driver Availability by Day of Week')
+    ax.set_xlabel('Driver Available?')
+    ax.set_ylabel('Number of Requests')
+    _finish(show)
 
 # ----------------------------------------------------------------
 # Driver Availability by Time Slot
 # ----------------------------------------------------------------
-def plot_driver_availability_by_slot(df):
+def plot_driver_availability_by_slot(df, ax=None):
     """
     Stacked bar showing driver availability by time of day
     """
-    sns.countplot(x='Driver Available', hue='Time slot', data=df, palette='crest')
-    plt.title('Driver Availability by Time Slot')
-    plt.xlabel('Driver Available?')
-    plt.ylabel('Number of Requests')
-    plt.show()
+    ax, show = _get_axes(ax)
+    counts = cube_counts(df, ['Driver Available', 'Time slot']).reset_index()
+    sns.barplot(x='Driver Available', y='Count', hue='Time slot', data=counts, palette='crest', ax=ax)
+    ax.set_title('Driver Availability by Time Slot')
+    ax.set_xlabel('Driver Available?')
+    ax.set_ylabel('Number of Requests')
+    _finish(show)
 
 # ----------------------------------------------------------------
 # Number of Requests Per Day of the Week
 # ----------------------------------------------------------------
-def plot_requests_per_weekday(df):
+def plot_requests_per_weekday(df, ax=None):
     """
     Bar chart showing number of ride requests per day of the week.
     """
+    ax, show = _get_axes(ax)
     order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
-    sns.countplot(x='Request day', data=df, order=order)
-    plt.title('Amount of Daily Requests per Week')
-    plt.xlabel('Week Day')
-    plt.ylabel('Total Requests')
-    plt.show()
+    counts = cube_counts(df, 'Request day').reindex(order, fill_value=0)
+    sns.barplot(x=counts.index, y=counts.values, ax=ax)
+    ax.set_title('Amount of Daily Requests per Week')
+    ax.set_xlabel('Week Day')
+    ax.set_ylabel('Total Requests')
+    _finish(show)
 
 # ----------------------------------------------------------------
 # KMeans Clustering Plot (after clustering is done externally)
 # ----------------------------------------------------------------
-def plot_location_clusters(df):
+def plot_location_clusters(df, ax=None, mode='auto', bins=200):
     """
-    Visualizes clusters of locations using KMeans result
+    Visualizes clusters of locations using KMeans result.
+    With mode='density' (automatic above DENSITY_THRESHOLD rows) each
+    grid cell is coloured by its most frequent cluster, with the opacity
+    following the (log) number of requests in the cell.
     """
-    sns.scatterplot(x='Longitude', y='Latitude', hue='cluster', data=df, palette='viridis', s=15)
-    plt.title('K-Means Clustering of Pickup Locations')
-    plt.xlabel('Longitude')
-    plt.ylabel('Latitude')
-    plt.grid(True)
-    plt.show()
+    ax, show = _get_axes(ax)
+    if _use_density(df, mode):
+        counts, extent, clusters = density_grid(df['Longitude'], df['Latitude'], bins,
+                                                groups=df['cluster'])
+        colors = np.array(sns.color_palette('viridis', len(clusters)))
+        total = counts.sum(axis=0)
+        alpha = np.log1p(total) / np.log1p(max(total.max(), 1))
+        rgba = np.dstack([colors[counts.argmax(axis=0)], alpha])
+        ax.imshow(rgba, extent=extent, origin='lower', aspect='auto', interpolation='nearest')
+        ax.legend(handles=[Patch(color=c, label=str(k)) for k, c in zip(clusters, colors)],
+                  title='cluster')
+    else:
+        sns.scatterplot(x='Longitude', y='Latitude', hue='cluster', data=df, palette='viridis', s=15, ax=ax)
+    ax.set_title('K-Means Clustering of Pickup Locations')
+    ax.set_xlabel('Longitude')
+    ax.set_ylabel('Latitude')
+    ax.grid(True)
+    _finish(show)
@@ -0,0 +1,74 @@
+# ================================================================
+# 15. Driver Statistics
+# Per-driver trip counts and rates, computed once and shared
+# ================================================================
+
+DRIVER_STATS = ['Trips', 'Completed', 'Cancelled', 'Completion rate',
+                'Avg Duration Mins', 'Active hours']
+
+# ----------------------------------------------------------------
+# Build every per-driver statistic in a single groupby pass
+# ----------------------------------------------------------------
+def build_driver_stats(df):
+    """
+    Aggregates the requests of every assigned driver (Driver id > 0):
+    - Trips: requests assigned to the driver
+    - Completed / Cancelled: trips per outcome
+    - Completion rate: Completed / Trips
+    - Avg Duration Mins: mean duration of the completed trips
+    - Active hours: distinct clock hours (date + hour) with a request
+
+    Build it once and pass it to plot_top_drivers / top_drivers instead
+    of the raw rows, so the aggregation is not repeated (main, the plot
+    renderer and the pipeline runner do). There is no hidden cache: a
+    DataFrame is mutable and unhashable, so a cache keyed on it could hand
+    back statistics of rows that have since changed.
+
+    Parameters:
+    - df: feature-engineered DataFrame
+
+    Returns:
+    - DataFrame indexed by 'Driver id' with the DRIVER_STATS columns
+    """
+    assigned = df[df['Driver id'] > 0]
+    stats = (
+        assigned.assign(**{
+            'Cancelled': assigned['Status'] == 'Cancelled',
+            'Active hour': assigned['Request timestamp'].dt.floor('h'),
+            # Durations are stored as 0 for trips that never happened
+            'Completed duration': assigned['Trip Duration Mins'].where(assigned['Is Completed']),
+        })
+        .groupby('Driver id')
+        .agg(**{
+            'Trips': ('Request id', 'size'),
+            'Completed': ('Is Completed', 'sum'),
+            'Cancelled': ('Cancelled', 'sum'),
+            'Avg Duration Mins': ('Completed duration', 'mean'),
+            'Active hours': ('Active hour', 'nunique'),
+        })
+    )
+    stats['Completion rate'] = stats['Completed'] / stats['Trips']
+    stats = stats[DRIVER_STATS]
+    stats.attrs['driver_stats'] = True
+    return stats
+
+def is_driver_stats(df):
+    """
+    True if df was produced by build_driver_stats.
+    """
+    return bool(df.attrs.get('driver_stats', False))
+
+# ----------------------------------------------------------------
+# Top-N drivers by partial selection (no full sort)
+# ----------------------------------------------------------------
+def top_drivers(df, n=10, by='Trips'):
+    """
+    The n drivers with the largest value of `by`. Accepts the driver
+    statistics or raw rows (in which case the statistics are built first,
+    on every call; pass the output of build_driver_stats to reuse them).
+
+    Returns:
+    - the top n rows of the driver statistics, largest first
+    """
+    stats = df if is_driver_stats(df) else build_driver_stats(df)
+    return stats.nlargest(n, by)
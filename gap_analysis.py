@@ -0,0 +1,168 @@
+# ================================================================
+# 16. Supply-Demand Gap Analysis
+# Requests vs. completed trips per pickup point over rolling windows
+# ================================================================
+
+import argparse
+import os
+
+import pandas as pd
+
+from .data_loading_and_exploration import load_data
+from .data_cleaning_and_preprocessing import clean_data
+from .data_feature_engineering import engineer_features
+from .incremental_ingestion import load_feature_store
+
+GAP_WINDOWS = ('15min', '30min', '60min')
+GAP_MEASURES = ['Requests', 'Completed', 'Cancelled', 'No Cars Available']
+GAP_COLUMNS = ['Request timestamp', 'Pickup point', 'Status']
+
+# ----------------------------------------------------------------
+# Step 1: Count requests per pickup point and time bucket
+# ----------------------------------------------------------------
+def bucket_counts(df, freq='5min'):
+    """
+    Requests and their outcome per (Pickup point, time bucket), buckets
+    being the request timestamp floored to freq.
+
+    Returns:
+    - DataFrame indexed by (Time, Pickup point) with the GAP_MEASURES
+    """
+    status = df['Status']
+    counts = pd.DataFrame({
+        'Time': df['Request timestamp'].dt.floor(freq),
+        'Pickup point': df['Pickup point'].astype(str),
+        'Requests': 1,
+        'Completed': status == 'Trip Completed',
+        'Cancelled': status == 'Cancelled',
+        'No Cars Available': status == 'No Cars Available',
+    })
+    return counts.groupby(['Time', 'Pickup point']).sum().astype('int64')
+
+# ----------------------------------------------------------------
+# Step 2: Rolling windows over the bucket counts
+# ----------------------------------------------------------------
+def _rolling_gaps(counts, windows, freq, start, stop):
+    """
+    Rolls every window over the counts (all pickup points at once, on a
+    regular time grid) and keeps the buckets in [start, stop) that saw at
+    least one request in the window.
+    """
+    wide = counts.unstack('Pickup point', fill_value=0)
+    first = wide.index.min() if start is None else min(start, wide.index.min())
+    wide = wide.reindex(pd.date_range(first, wide.index.max(), freq=freq), fill_value=0)
+    wide.index.name = 'Time'
+
+    results = []
+    for window in windows:
+        rolled = wide.rolling(window).sum().stack('Pickup point', future_stack=True)
+        rolled = rolled.astype('int64').reset_index()
+        keep = rolled['Requests'] > 0
+        if start is not None:
+            keep &= rolled['Time'] >= start
+        if stop is not None:
+            keep &= rolled['Time'] < stop
+        results.append(rolled[keep].assign(Window=window))
+
+    gaps = pd.concat(results, ignore_index=True)
+    gaps['Gap'] = gaps['Requests'] - gaps['Completed']
+    gaps['Gap rate'] = gaps['Gap'] / gaps['Requests']
+    return gaps[['Pickup point', 'Window', 'Time', *GAP_MEASURES, 'Gap', 'Gap rate']]
+
+# ----------------------------------------------------------------
+# Step 3: Streaming over time-sorted chunks
+# ----------------------------------------------------------------
+def stream_gap_analysis(chunks, windows=GAP_WINDOWS, freq='5min'):
+    """
+    Computes the rolling supply-demand gaps over an iterable of chunks of
+    feature-engineered rows (e.g. one day at a time). Only the bucket
+    counts of the last window are kept between chunks, so memory does not
+    grow with the time span covered.
+
+    Chunks must come in time order (rows inside a chunk may be unsorted).
+    Results for the last time bucket of a chunk are emitted with the
+    next chunk, since more requests may still fall into that bucket.
+
+    Parameters:
+    - chunks: iterable of DataFrames with 'Request timestamp',
+      'Pickup point' and 'Status'
+    - windows: rolling window lengths, multiples of freq
+    - freq: width of the time buckets the windows roll over
+
+    Yields:
+    - DataFrames with one row per (Pickup point, Window, Time): the
+      window ending at Time (bucket start) and its requests, completed
+      trips, cancellations, 'No Cars Available', Gap (requests not
+      completed) and Gap rate
+    """
+    step = pd.Timedelta(freq)
+    for window in windows:
+        if pd.Timedelta(window) % step:
+            raise ValueError(f"window {window!r} is not a multiple of freq {freq!r}")
+    history = max(pd.Timedelta(w) for w in windows)
+
+    carry, emitted = None, None
+    for chunk in chunks:
+        if chunk.empty:
+            continue
+        counts = bucket_counts(chunk, freq)
+        horizon = counts.index.get_level_values('Time').max()
+        if emitted is not None and counts.index.get_level_values('Time').min() < emitted:
+            raise ValueError("chunks must be in time order")
+        if carry is not None:
+            counts = pd.concat([carry, counts]).groupby(level=['Time', 'Pickup point']).sum()
+
+        # Everything before the last bucket of this chunk is final
+        yield _rolling_gaps(counts, windows, freq, emitted, horizon)
+        emitted = horizon
+        times = counts.index.get_level_values('Time')
+        carry = counts[times > horizon - history]
+
+    if carry is not None:
+        yield _rolling_gaps(carry, windows, freq, emitted, None)
+
+def gap_analysis(df, windows=GAP_WINDOWS, freq='5min'):
+    """
+    Rolling supply-demand gaps of an in-memory frame (see
+    stream_gap_analysis for the output columns).
+    """
+    return pd.concat(stream_gap_analysis([df], windows, freq), ignore_index=True)
+
+def gap_analysis_from_store(store_dir='output/feature_store', windows=GAP_WINDOWS,
+                            freq='5min', start=None, end=None):
+    """
+    Rolling supply-demand gaps over the feature store, reading one Request
+    Date partition (and only the needed columns) at a time.
+    """
+    folder = os.path.join(store_dir, 'features')
+    dates = sorted(d for d in os.listdir(folder)
+                   if (start is None or d >= start) and (end is None or d <= end))
+    days = (load_feature_store(store_dir, d, d, columns=GAP_COLUMNS) for d in dates)
+    return pd.concat(stream_gap_analysis(days, windows, freq), ignore_index=True)
+
+def worst_gaps(gaps, window='60min', n=10):
+    """
+    The n (Pickup point, Time) windows with the most unserved requests.
+    """
+    return gaps[gaps['Window'] == window].nlargest(n, 'Gap')
+
+# ----------------------------------------------------------------
+# Command line: python -m src.gap_analysis --store output/feature_store
+# ----------------------------------------------------------------
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser(description='Supply-demand gaps per pickup point')
+    cli.add_argument('--input', default='data/Uber Request Data.csv')
+    cli.add_argument('--store', help='read the feature store day by day instead of --input')
+    cli.add_argument('--window', default='60min', help='window for the worst-gap listing')
+    cli.add_argument('--output', help='write all gaps to this Parquet file')
+    args = cli.parse_args()
+
+    if args.store:
+        gaps = gap_analysis_from_store(args.store)
+    else:
+        gaps = gap_analysis(engineer_features(clean_data(load_data(args.input))))
+
+    print(f"\n🚕 Largest supply-demand gaps ({args.window} windows):")
+    print(worst_gaps(gaps, args.window).to_string(index=False))
+    if args.output:
+        gaps.to_parquet(args.output, index=False)
@@ -0,0 +1,148 @@
+# ================================================================
+# 11. Incremental Ingestion
+# Append new request files to a date-partitioned feature store
+# ================================================================
+
+import argparse
+import os
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from .data_loading_and_exploration import load_data
+from .data_cleaning_and_preprocessing import clean_data
+from .data_feature_engineering import engineer_features
+from .summary_cube import build_request_cube, merge_cubes
+
+# ----------------------------------------------------------------
+# Store layout
+#   <store>/seen_request_ids.npy      sorted Request ids already ingested
+#   <store>/features/<YYYY-MM-DD>/    one folder per Request Date
+#   <store>/summary_cube.parquet      running request counts (see summary_cube)
+#   <store>/driver_counts.parquet     running trips / completed per driver
+# ----------------------------------------------------------------
+def _store_paths(store_dir):
+    return {
+        'ids': os.path.join(store_dir, 'seen_request_ids.npy'),
+        'features': os.path.join(store_dir, 'features'),
+        'cube': os.path.join(store_dir, 'summary_cube.parquet'),
+        'drivers': os.path.join(store_dir, 'driver_counts.parquet'),
+    }
+
+def load_seen_ids(store_dir):
+    """
+    Returns the sorted array of Request ids already in the store.
+    """
+    path = _store_paths(store_dir)['ids']
+    return np.load(path) if os.path.exists(path) else np.empty(0, dtype=np.int64)
+
+# ----------------------------------------------------------------
+# Running aggregates, updated by adding the counts of the new rows
+# ----------------------------------------------------------------
+def build_driver_counts(df):
+    """
+    Trips and completed trips per assigned driver.
+    """
+    assigned = df[df['Driver id'] > 0]
+    return assigned.groupby('Driver id').agg(
+        Trips=('Request id', 'size'),
+        Completed=('Is Completed', 'sum'),
+    )
+
+def _update_aggregate(path, new, merge):
+    if os.path.exists(path):
+        new = merge(pd.read_parquet(path), new)
+    new.to_parquet(path)
+    return new
+
+# ----------------------------------------------------------------
+# Ingest one raw request file
+# ----------------------------------------------------------------
+def ingest_file(path, store_dir='output/feature_store'):
+    """
+    Adds the requests of a raw file that are not in the store yet:
+    - rows whose Request id was already ingested are skipped
+    - the new rows are cleaned, feature-engineered and appended as one
+      Parquet file per Request Date folder
+    - the summary cube and driver counts are updated with the new rows only
+
+    Parameters:
+    - path: raw tab-separated request file
+    - store_dir: feature store folder (created if missing)
+
+    Returns:
+    - dict with the number of rows read, skipped and ingested, and the
+      dates touched
+    """
+    paths = _store_paths(store_dir)
+    os.makedirs(paths['features'], exist_ok=True)
+
+    raw = load_data(path)
+    seen = load_seen_ids(store_dir)
+    new = raw[~raw['Request id'].isin(seen)].drop_duplicates('Request id')
+    stats = {'file': path, 'rows': len(raw), 'skipped': len(raw) - len(new),
+             'ingested': 0, 'dates': []}
+    if new.empty:
+        print(f"⏭️ No new requests in {path}")
+        return stats
+
+    df = engineer_features(clean_data(new))
+
+    # Append the new rows to their date partitions
+    part_name = f'part-{uuid.uuid4().hex}.parquet'
+    for date, part in df.groupby('Request Date'):
+        date = f'{pd.Timestamp(date):%Y-%m-%d}'
+        folder = os.path.join(paths['features'], date)
+        os.makedirs(folder, exist_ok=True)
+        part.reset_index(drop=True).to_parquet(os.path.join(folder, part_name), index=False)
+        stats['dates'].append(date)
+
+    # Update the running aggregates with the new rows only
+    _update_aggregate(paths['cube'], build_request_cube(df), merge_cubes)
+    _update_aggregate(paths['drivers'], build_driver_counts(df),
+                      lambda old, new: old.add(new, fill_value=0).astype('int64'))
+
+    # The id index is written last: it only records rows already stored
+    np.save(paths['ids'], np.union1d(seen, new['Request id'].to_numpy(dtype=np.int64)))
+
+    stats['ingested'] = len(df)
+    print(f"📦 Ingested {len(df)} new requests from {path} "
+          f"({stats['skipped']} already seen) into {len(stats['dates'])} date partitions")
+    return stats
+
+# ----------------------------------------------------------------
+# Read back from the store
+# ----------------------------------------------------------------
+def load_feature_store(store_dir='output/feature_store', start=None, end=None, columns=None):
+    """
+    Reads the engineered rows for Request Dates between start and end
+    (inclusive, 'YYYY-MM-DD'); only the matching date folders are opened.
+    """
+    folder = _store_paths(store_dir)['features']
+    dates = sorted(d for d in os.listdir(folder)
+                   if (start is None or d >= start) and (end is None or d <= end))
+    files = [os.path.join(folder, d, f) for d in dates for f in sorted(os.listdir(os.path.join(folder, d)))]
+    if not files:
+        return pd.DataFrame(columns=columns)
+    return pd.concat([pd.read_parquet(f, columns=columns) for f in files], ignore_index=True)
+
+def load_summary_cube(store_dir='output/feature_store'):
+    """
+    Returns the running summary cube of the store.
+    """
+    cube = pd.read_parquet(_store_paths(store_dir)['cube'])
+    cube.attrs['request_cube'] = True
+    return cube
+
+# ----------------------------------------------------------------
+# Command line: python -m src.incremental_ingestion FILE [FILE ...]
+# ----------------------------------------------------------------
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser(description='Ingest new Uber request files into the feature store')
+    cli.add_argument('files', nargs='+')
+    cli.add_argument('--store', default='output/feature_store')
+    args = cli.parse_args()
+
+    for file in args.files:
+        ingest_file(file, args.store)
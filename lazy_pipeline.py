@@ -0,0 +1,243 @@
+# ================================================================
+# 19. Lazy Pipeline
+# Describe the output you need; only that is loaded and computed
+#   lazy_query('data/Uber Request Data.csv', ['Request hour', 'Status'],
+#              pickup_point='Airport', start='2016-07-01', end='2016-07-31')
+# ================================================================
+
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from .data_cleaning_and_preprocessing import clean_data, clean_text, parse_timestamps
+from .data_feature_engineering import (FEATURE_COLUMNS, WEEKDAYS, engineer_features, get_time_periods,
+                                       trip_duration_text)
+from .data_loading_and_exploration import RAW_DTYPES, load_data
+from .save_transformed_data import get_file_format
+
+RAW_COLUMNS = list(RAW_DTYPES)
+CLUSTER_COLUMNS = ['Latitude', 'Longitude', 'cluster']
+
+# Filter name -> column; each filter accepts one value or a list
+LAZY_FILTERS = {
+    'pickup_point': 'Pickup point',
+    'status': 'Status',
+    'hour': 'Request hour',
+    'weekday': 'Request day',
+    'time_slot': 'Time slot',
+    'cluster': 'cluster',
+}
+
+# ----------------------------------------------------------------
+# Step 1: Turn the description of the output into a plan
+# ----------------------------------------------------------------
+def plan_query(columns, start=None, end=None, **filters):
+    """
+    Works out what has to be read and computed for the requested output.
+
+    Parameters:
+    - columns: output columns (raw, feature or cluster columns)
+    - start, end: Request Date bounds, inclusive ('YYYY-MM-DD')
+    - pickup_point, status, hour, weekday, time_slot, cluster: one value
+      or a list of values
+
+    Returns:
+    - plan (dict):
+      - columns: the output columns, in the requested order
+      - filters: filtered column -> list of allowed values
+      - dates: (start, end) as Timestamps (None when open)
+      - read: columns read from a parquet/feather table or feature store
+      - features: engineered columns to compute (output + filters)
+      - clustering: whether coordinates and clusters are needed
+      - pushdown: filtered columns applied before cleaning
+    """
+    known = set(RAW_COLUMNS) | set(FEATURE_COLUMNS) | set(CLUSTER_COLUMNS)
+    unknown = [c for c in columns if c not in known]
+    if unknown:
+        raise ValueError(f"Unknown columns {unknown}")
+    unknown = set(filters) - set(LAZY_FILTERS)
+    if unknown:
+        raise ValueError(f"Unknown filters {sorted(unknown)}; use {sorted(LAZY_FILTERS)}")
+
+    selected = {LAZY_FILTERS[name]: _filter_values(LAZY_FILTERS[name], values)
+                for name, values in filters.items() if values is not None}
+    dates = (None if start is None else pd.Timestamp(start), None if end is None else pd.Timestamp(end))
+
+    used = list(dict.fromkeys([*columns, *selected, *(['Request Date'] if any(dates) else [])]))
+    clustering = any(c in CLUSTER_COLUMNS for c in used)
+
+    return {
+        'columns': list(columns),
+        'filters': selected,
+        'dates': dates,
+        'read': used,
+        'features': [c for c in FEATURE_COLUMNS if c in used],
+        'clustering': clustering,
+        # Coordinates depend on each row's position in the full cleaned
+        # frame, so rows can only be dropped early without clustering
+        'pushdown': [] if clustering else [*selected, *(['Request Date'] if any(dates) else [])],
+    }
+
+def _filter_values(column, values):
+    values = np.atleast_1d(values).tolist()
+    if column in ('Request hour', 'cluster'):
+        return sorted({int(v) for v in values})
+    return sorted({str(v) for v in values})
+
+def explain(plan):
+    """
+    Describes a plan in a few lines of text (what is read, computed, skipped).
+    """
+    skipped = [c for c in FEATURE_COLUMNS if c not in plan['features']]
+    start, end = (d.date() if d is not None else '...' for d in plan['dates'])
+    lines = [
+        f"output:     {', '.join(plan['columns'])}",
+        f"filters:    {plan['filters'] or '-'}; dates {start} to {end}",
+        f"read:       {', '.join(plan['read'])} (columnar sources)",
+        f"pushdown:   {', '.join(plan['pushdown']) or '-'}",
+        f"features:   {', '.join(plan['features']) or '-'}",
+        f"skipped:    {', '.join(skipped) or '-'}",
+        f"clustering: {'yes' if plan['clustering'] else 'skipped'}",
+    ]
+    return '\n'.join(lines)
+
+# ----------------------------------------------------------------
+# Step 2: Row filters, on any frame holding the filtered columns
+# ----------------------------------------------------------------
+def _row_mask(df, plan, columns=None):
+    """
+    Boolean mask of the rows passing the plan's filters (restricted to the
+    given columns); columns that are missing from df are skipped.
+    """
+    columns = plan['filters'].keys() | {'Request Date'} if columns is None else columns
+    mask = np.ones(len(df), dtype=bool)
+    for column, values in plan['filters'].items():
+        if column in columns and column in df.columns:
+            mask &= df[column].isin(values).to_numpy(dtype=bool, na_value=False)
+    start, end = plan['dates']
+    if 'Request Date' in columns and 'Request Date' in df.columns and (start or end):
+        dates = pd.to_datetime(df['Request Date'])
+        if start is not None:
+            mask &= (dates >= start).to_numpy(dtype=bool, na_value=False)
+        if end is not None:
+            mask &= (dates <= end).to_numpy(dtype=bool, na_value=False)
+    return mask
+
+def _push_down(raw, plan):
+    """
+    Applies the pushdown filters to the raw rows, cheapest first: the text
+    filters (cleaned once per category), then the time filters, for which
+    'Request timestamp' is parsed on the remaining rows only and kept
+    parsed so clean_data does not parse it again.
+
+    A row failing a filter fails it after cleaning too, and identical rows
+    share the outcome, so filtering first leaves the de-duplication in
+    clean_data unchanged.
+    """
+    pushdown = set(plan['pushdown'])
+    text = {c: clean_text(raw[c]) for c in ('Pickup point', 'Status') if c in pushdown}
+    if text:
+        raw = raw[_row_mask(pd.DataFrame(text, index=raw.index), plan, pushdown)]
+
+    if pushdown & {'Request hour', 'Request day', 'Time slot', 'Request Date'}:
+        requested, _ = parse_timestamps(raw['Request timestamp'])
+        hour = requested.dt.hour.astype('Int64')
+        times = pd.DataFrame({
+            'Request hour': hour,
+            'Request day': requested.dt.dayofweek.map(dict(enumerate(WEEKDAYS))),
+            'Time slot': get_time_periods(hour),
+            'Request Date': requested.dt.normalize(),
+        }, index=raw.index)
+        keep = _row_mask(times, plan, pushdown)
+        raw = raw[keep].assign(**{'Request timestamp': requested[keep]})
+    return raw
+
+# ----------------------------------------------------------------
+# Step 3: Run the plan
+# ----------------------------------------------------------------
+def execute_plan(plan, source='data/Uber Request Data.csv', n_clusters=5,
+                 model_path='output/cluster_model.pkl'):
+    """
+    Runs a plan from plan_query on a source:
+    - raw CSV export: pushdown filters drop rows before cleaning, and only
+      the planned features are computed. Clusters come from the saved
+      model at model_path, as in main(), so the ids match the persisted
+      ones (see cluster_with_saved_model)
+    - parquet/feather feature table or feature store folder: only the
+      output and filter columns are read (parquet filters and date folders
+      prune the rest); the columns must be stored in the source
+
+    Returns:
+    - DataFrame with plan['columns'], indexed like the eager pipeline output
+    """
+    if os.path.isdir(source) or get_file_format(source) in ('parquet', 'feather'):
+        df = _read_columnar(plan, source)
+        return df.loc[_row_mask(df, plan), plan['columns']]
+
+    # The cleaning de-duplicates whole rows, so every raw column is read
+    df = load_data(source)
+    if plan['pushdown']:
+        df = _push_down(df, plan)
+    df = clean_data(df)
+
+    if plan['clustering']:
+        from .location_clustering import add_random_coordinates, cluster_with_saved_model
+        df = cluster_with_saved_model(add_random_coordinates(df), model_path, n_clusters=n_clusters)
+        df = df[_row_mask(df, plan, ['Pickup point', 'Status', 'cluster'])]
+
+    df = engineer_features(df, features=plan['features'])
+    if 'Trip duration' in plan['features']:
+        df = df.assign(**{'Trip duration': trip_duration_text(df)})
+    return df.loc[_row_mask(df, plan), plan['columns']]
+
+def _read_columnar(plan, source):
+    columns = plan['read']
+    start, end = (d.strftime('%Y-%m-%d') if d is not None else None for d in plan['dates'])
+    if os.path.isdir(source):
+        from .incremental_ingestion import load_feature_store
+        return load_feature_store(source, start, end, columns)
+    if get_file_format(source) == 'feather':
+        return pd.read_feather(source, columns=columns)
+
+    filters = [(column, 'in', values) for column, values in plan['filters'].items()]
+    if plan['dates'][0] is not None:
+        filters.append(('Request Date', '>=', plan['dates'][0]))
+    if plan['dates'][1] is not None:
+        filters.append(('Request Date', '<=', plan['dates'][1]))
+    return pd.read_parquet(source, columns=columns, filters=filters or None)
+
+def lazy_query(source, columns, n_clusters=5, model_path='output/cluster_model.pkl', **filters):
+    """
+    Plans and runs a query in one call (see plan_query for the filters),
+    e.g. lazy_query(path, ['Request hour', 'Status'], pickup_point='Airport').
+    """
+    return execute_plan(plan_query(columns, **filters), source, n_clusters=n_clusters,
+                        model_path=model_path)
+
+# ----------------------------------------------------------------
+# Command line: python -m src.lazy_pipeline --columns "Request hour" Status --pickup-point Airport
+# ----------------------------------------------------------------
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser(description='Query only the columns and rows you need')
+    cli.add_argument('--source', default='data/Uber Request Data.csv')
+    cli.add_argument('--columns', nargs='+', required=True)
+    cli.add_argument('--start')
+    cli.add_argument('--end')
+    for name in LAZY_FILTERS:
+        cli.add_argument(f"--{name.replace('_', '-')}", nargs='+')
+    cli.add_argument('--model-path', default='output/cluster_model.pkl')
+    cli.add_argument('--output', help='save the result here instead of printing it')
+    args = vars(cli.parse_args())
+
+    source, output, model_path = args.pop('source'), args.pop('output'), args.pop('model_path')
+    plan = plan_query(args.pop('columns'), **args)
+    print(explain(plan))
+    result = execute_plan(plan, source, model_path=model_path)
+    if output is None:
+        print(result.head(20))
+        print(f"{len(result):,} rows")
+    else:
+        from .save_transformed_data import save_data
+        save_data(result, output)
@@ -2,14 +2,23 @@
 # 5. Clustering Module (K-Means on Simulated Location Data)
 # ================================================================
 
+import os
+import pickle
+import time
+
 import numpy as np
 import pandas as pd
-from sklearn.cluster import KMeans
+from joblib import Parallel, delayed
+from scipy.optimize import linear_sum_assignment
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.metrics import silhouette_score
+
+CLUSTERING_ENGINES = ('kmeans', 'minibatch', 'sample')
 
 # ----------------------------------------------------------------
 # Step 1: Add Random Coordinates to Simulate Location Data
 # ----------------------------------------------------------------
-def add_random_coordinates(df, seed=42):
+def add_random_coordinates(df, seed=42, dtype='float32'):
     """
     Adds random Latitude and Longitude columns to the DataFrame
     to simulate pickup/drop locations.
@@ -17,34 +26,271 @@ def add_random_coordinates(df, seed=42):
     Parameters:
     - df: DataFrame
     - seed: int (random seed for reproducibility)
+    - dtype: dtype of the new columns (float32 by default to save memory)
 
     Returns:
-    - DataFrame with 'Latitude' and 'Longitude' columns
+    - new DataFrame with 'Latitude' and 'Longitude' columns (df is not modified)
     """
     np.random.seed(seed)
     N = len(df)
-    df['Latitude'] = np.random.uniform(-10, 10, size=N)
-    df['Longitude'] = np.random.uniform(-20, 20, size=N)
-    return df
+    latitude = np.random.uniform(-10, 10, size=N).astype(dtype)
+    longitude = np.random.uniform(-20, 20, size=N).astype(dtype)
+    return df.assign(Latitude=latitude, Longitude=longitude)
 
 # ----------------------------------------------------------------
 # Step 2: Perform KMeans Clustering on the Coordinates
 # ----------------------------------------------------------------
-def perform_clustering(df, n_clusters=5):
+def perform_clustering(df, n_clusters=5, engine='kmeans', batch_size=4096,
+                       sample_size=100_000, chunksize=500_000, dtype='float64',
+                       random_state=42):
     """
     Applies KMeans clustering on 'Latitude' and 'Longitude' columns
     and adds a 'cluster' label to each row.
+
+    Engines:
+    - 'kmeans': full-batch KMeans on every row (default)
+    - 'minibatch': MiniBatchKMeans with the given batch_size
+    - 'sample': KMeans fitted on a random sample of sample_size rows,
+      the remaining rows are then labelled chunk by chunk
     
     Parameters:
     - df: DataFrame with 'Latitude' and 'Longitude'
     - n_clusters: number of clusters (default is 5)
+    - engine: one of 'kmeans', 'minibatch', 'sample'
+    - batch_size: mini-batch size for the 'minibatch' engine
+    - sample_size: number of rows to fit on for the 'sample' engine
+    - chunksize: rows labelled per chunk ('minibatch' and 'sample')
+    - dtype: 'float64' or 'float32' (float32 halves the memory used)
+    - random_state: seed for the estimator and the sample
+
+    Returns:
+    - new DataFrame with column 'cluster' (integer labels); df is not
+      modified. .attrs['clustering'] holds the engine, the centroids (as
+      [Longitude, Latitude] pairs), inertia (over all rows) and fit/assign
+      timings in seconds.
+    """
+    if engine not in CLUSTERING_ENGINES:
+        raise ValueError(f"engine must be one of {CLUSTERING_ENGINES}, got {engine!r}")
+
+    X = df[['Longitude', 'Latitude']].to_numpy(dtype=dtype)
+
+    start = time.perf_counter()
+    if engine == 'kmeans':
+        model = KMeans(n_clusters=n_clusters, random_state=random_state).fit(X)
+    elif engine == 'minibatch':
+        model = MiniBatchKMeans(n_clusters=n_clusters, batch_size=batch_size,
+                                compute_labels=False, random_state=random_state).fit(X)
+    else:
+        rng = np.random.default_rng(random_state)
+        sample = X[rng.choice(len(X), size=sample_size, replace=False)] if len(X) > sample_size else X
+        model = KMeans(n_clusters=n_clusters, random_state=random_state).fit(sample)
+    fit_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if engine == 'kmeans':
+        labels, inertia = model.labels_, float(model.inertia_)
+    else:
+        labels, inertia = assign_clusters(model.cluster_centers_, X, chunksize)
+    assign_seconds = time.perf_counter() - start
+
+    df = df.assign(cluster=labels)
+    df.attrs['clustering'] = {
+        'engine': engine,
+        'n_clusters': n_clusters,
+        'centers': model.cluster_centers_.tolist(),
+        'inertia': inertia,
+        'fit_seconds': fit_seconds,
+        'assign_seconds': assign_seconds,
+    }
+    return df
+
+# ----------------------------------------------------------------
+# Label points by their nearest centroid, one chunk at a time
+# ----------------------------------------------------------------
+def assign_clusters(centers, X, chunksize=500_000):
+    """
+    Assigns each row of X to its nearest centroid in chunks, so the
+    distance matrix never exceeds chunksize x n_clusters.
+
+    Returns:
+    - labels (ndarray of int32)
+    - inertia (float): sum of squared distances to the assigned centroids
+    """
+    centers = np.asarray(centers, dtype=X.dtype)
+    labels = np.empty(len(X), dtype=np.int32)
+    inertia = 0.0
+    for start in range(0, len(X), chunksize):
+        chunk = X[start:start + chunksize]
+        dist = ((chunk[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+        nearest = dist.argmin(axis=1)
+        labels[start:start + chunksize] = nearest
+        inertia += float(dist[np.arange(len(chunk)), nearest].sum())
+    return labels, inertia
+
+# ----------------------------------------------------------------
+# Step 2b: Choose k automatically (parallel sweep over k values)
+# ----------------------------------------------------------------
+def _score_k(X, k, silhouette_sample, random_state):
+    """
+    Fits KMeans with k clusters and scores it with inertia and a
+    silhouette computed on a random sample of rows.
+    """
+    model = KMeans(n_clusters=k, random_state=random_state).fit(X)
+    score = silhouette_score(X, model.labels_, sample_size=min(silhouette_sample, len(X)),
+                             random_state=random_state)
+    return {'k': k, 'inertia': float(model.inertia_), 'silhouette': float(score),
+            'centers': model.cluster_centers_}
+
+def sweep_n_clusters(df, k_values=range(2, 11), silhouette_sample=10_000, n_jobs=-1,
+                     random_state=42):
+    """
+    Fits KMeans for every k in k_values in parallel (one process per k)
+    and keeps the k with the best sampled silhouette. Full silhouette is
+    O(n^2), so it is only evaluated on silhouette_sample rows.
+
+    Parameters:
+    - df: DataFrame with 'Latitude' and 'Longitude'
+    - k_values: candidate numbers of clusters
+    - silhouette_sample: rows used for the silhouette score
+    - n_jobs: worker processes (-1 = all cores)
+    - random_state: seed for KMeans and the silhouette sample
+
+    Returns:
+    - new DataFrame with column 'cluster' labelled with the best k
+    - scores (DataFrame): k, inertia, silhouette and the elbow k flagged
+    """
+    X = df[['Longitude', 'Latitude']].to_numpy(dtype='float64')
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(_score_k)(X, k, silhouette_sample, random_state) for k in k_values
+    )
+
+    scores = pd.DataFrame(results).sort_values('k').reset_index(drop=True)
+    centers = dict(zip(scores['k'], scores.pop('centers')))
+
+    # Elbow = sharpest bend of the inertia curve (largest second difference)
+    scores['elbow'] = False
+    if len(scores) >= 3:
+        bend = scores['inertia'].diff().diff().shift(-1)
+        scores.loc[bend.idxmax(), 'elbow'] = True
+
+    best_k = int(scores.loc[scores['silhouette'].idxmax(), 'k'])
+    labels, inertia = assign_clusters(centers[best_k], X)
+
+    df = df.assign(cluster=labels)
+    df.attrs['clustering'] = {
+        'engine': 'kmeans_sweep',
+        'n_clusters': best_k,
+        'centers': centers[best_k].tolist(),
+        'inertia': inertia,
+    }
+    return df, scores
+
+# ----------------------------------------------------------------
+# Step 3: Persisted clustering model (stable cluster ids across runs)
+# ----------------------------------------------------------------
+def _fit_cluster_model(X, n_clusters, random_state, previous_centers=None):
+    """
+    Fits KMeans on X and wraps the centroids in a MiniBatchKMeans so the
+    model can later be updated with partial_fit. When previous_centers is
+    given, the new centroids are reordered to best match the old ones so
+    cluster ids keep their meaning after a refit.
+    """
+    centers = KMeans(n_clusters=n_clusters, random_state=random_state).fit(X).cluster_centers_
+    if previous_centers is not None:
+        cost = ((previous_centers[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+        _, order = linear_sum_assignment(cost)
+        centers = centers[order]
+
+    model = MiniBatchKMeans(n_clusters=n_clusters, init=centers, n_init=1,
+                            random_state=random_state)
+    return model.partial_fit(X)
+
+def load_cluster_model(path):
+    """
+    Loads a model saved by save_cluster_model, or returns None if the
+    file does not exist.
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+def save_cluster_model(state, path):
+    """
+    Saves the clustering state (model + reference inertia) to disk.
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'wb') as f:
+        pickle.dump(state, f)
+
+def cluster_with_saved_model(df, model_path='output/cluster_model.pkl', n_clusters=5,
+                             update=False, drift_threshold=0.25, random_state=42):
+    """
+    Labels rows with a clustering model that is kept on disk between runs
+    instead of refitting KMeans every time:
+    - no saved model yet: fit one on df and save it
+    - otherwise: label rows by their nearest saved centroid
+    - update=True: also move the centroids towards df with partial_fit
+    - if the mean squared distance to the centroids grew by more than
+      drift_threshold (relative to when the model was last fitted, so
+      gradual drift over several updates adds up), refit and reorder the
+      new centroids to match the old cluster ids
+    - a saved model with a different number of clusters is refitted
+
+    Parameters:
+    - df: DataFrame with 'Latitude' and 'Longitude'
+    - model_path: where the model is stored
+    - n_clusters: number of clusters
+    - update: update the saved centroids in place with the new rows
+    - drift_threshold: relative growth in mean squared distance that
+      triggers a refit
+    - random_state: seed used when fitting
 
     Returns:
-    - DataFrame with new column 'cluster' (integer labels)
+    - new DataFrame with column 'cluster' (df is not modified).
+      .attrs['clustering'] holds the action taken ('fit', 'assign',
+      'update' or 'refit') and the drift.
     """
-    X = df[['Longitude', 'Latitude']]
-    kmeans = KMeans(n_clusters=n_clusters, random_state=42)
-    df['cluster'] = kmeans.fit_predict(X)
+    X = df[['Longitude', 'Latitude']].to_numpy(dtype='float64')
+    state = load_cluster_model(model_path)
+    drift = 0.0
+
+    if state is None:
+        action = 'fit'
+        model = _fit_cluster_model(X, n_clusters, random_state)
+    elif state['model'].n_clusters != n_clusters:
+        action = 'refit'
+        model = _fit_cluster_model(X, n_clusters, random_state)
+    else:
+        model = state['model']
+        _, inertia = assign_clusters(model.cluster_centers_, X)
+        drift = (inertia / len(X)) / state['reference_inertia'] - 1
+        if drift > drift_threshold:
+            action = 'refit'
+            model = _fit_cluster_model(X, model.n_clusters, random_state,
+                                       previous_centers=model.cluster_centers_)
+        elif update:
+            action = 'update'
+            model.partial_fit(X)
+        else:
+            action = 'assign'
+
+    labels, inertia = assign_clusters(model.cluster_centers_, X)
+    if action in ('fit', 'refit'):
+        save_cluster_model({'model': model, 'reference_inertia': inertia / len(X)}, model_path)
+    elif action == 'update':
+        # Drift stays measured against the last fit, not the last update
+        save_cluster_model({**state, 'model': model}, model_path)
+
+    df = df.assign(cluster=labels)
+    df.attrs['clustering'] = {
+        'engine': 'saved_model',
+        'n_clusters': model.n_clusters,
+        'centers': model.cluster_centers_.tolist(),
+        'action': action,
+        'drift': drift,
+        'inertia': inertia,
+    }
     return df
 
 # ----------------------------------------------------------------
@@ -1,11 +1,14 @@
 # Import all necessary functions from the src package (enabled by __init__.py)
 from src import (
     load_data,
+    explore_data,
     clean_data,
     engineer_features,
     add_random_coordinates,
-    perform_clustering,
+    cluster_with_saved_model,
     save_data,
+    build_request_cube,
+    build_driver_stats,
     plot_time_slot_distribution,
     plot_hourly_requests,
     plot_request_heatmap,
@@ -15,12 +18,16 @@ from src import (
     plot_driver_availability_by_day,
     plot_driver_availability_by_slot,
     plot_requests_per_weekday,
-    plot_location_clusters
+    plot_location_clusters,
+    render_all_plots,
+    run_cached_pipeline
 )
 
-def main():
-    # Step 1: Load the raw Uber request dataset
+def run_pipeline_stages(show_plots=True):
+    # Step 1: Load the raw Uber request dataset and explore it
+    # (show_plots=False prints the report without opening plot windows)
     df = load_data('data/Uber Request Data.csv')
+    explore_data(df, show_plots=show_plots)
 
     # Step 2: Clean the dataset (parse dates, remove duplicates, fix missing and invalid values)
     df = clean_data(df)
@@ -29,28 +36,50 @@ def main():
     df = engineer_features(df)
     print("✅ Done cleaning and feature engineering!")
 
-    # (Optional) Check how requests are distributed by weekday
-    print("\n🗓️ Request count per weekday:")
-    print(df['Request day'].value_counts())
-
     # Step 4: Simulate GPS coordinates and perform clustering using KMeans
+    # (centroids are saved on the first run and reused afterwards)
     df = add_random_coordinates(df)
-    df = perform_clustering(df, n_clusters=5)
+    df = cluster_with_saved_model(df, 'output/cluster_model.pkl', n_clusters=5)
+    return df
+
+def main(plot_dir=None, use_cache=False):
+    # plot_dir: if given, plots are rendered to image files in that folder
+    # (in parallel, no windows) instead of being shown one by one
+    # use_cache: load the processed data from output/.cache when the input
+    # file and code are unchanged (skips exploration, steps 1-4)
+
+    if use_cache:
+        df = run_cached_pipeline('data/Uber Request Data.csv', 'output/.cache', n_clusters=5,
+                                 model_path='output/cluster_model.pkl')
+    else:
+        df = run_pipeline_stages(show_plots=plot_dir is None)
 
     # Step 5: Save the cleaned and enriched dataset to a new CSV file
     save_data(df, 'output/Uber with features.csv')
 
+    # (Optional) Check how requests are distributed by weekday
+    print("\n🗓️ Request count per weekday:")
+    print(df['Request day'].value_counts().loc[lambda counts: counts > 0])
+
     # Step 6: Generate all key visualizations for analysis
     print("\n📊 Generating visualizations...\n")
-    plot_time_slot_distribution(df)
-    plot_hourly_requests(df)
-    plot_request_heatmap(df)
+    if plot_dir is not None:
+        render_all_plots(df, plot_dir, formats=('png', 'svg'))
+        return
+
+    # Count plots share one pre-aggregated summary cube, driver plots
+    # share the per-driver statistics
+    cube = build_request_cube(df)
+    drivers = build_driver_stats(df)
+    plot_time_slot_distribution(cube)
+    plot_hourly_requests(cube)
+    plot_request_heatmap(cube)
     plot_trip_duration_boxplot(df)
     plot_trip_duration_scatter(df)
-    plot_top_drivers(df)
-    plot_driver_availability_by_day(df)
-    plot_driver_availability_by_slot(df)
-    plot_requests_per_weekday(df)
+    plot_top_drivers(drivers)
+    plot_driver_availability_by_day(cube)
+    plot_driver_availability_by_slot(cube)
+    plot_requests_per_weekday(cube)
     plot_location_clusters(df)
 
 # Run the main pipeline if this file is executed directly
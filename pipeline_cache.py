@@ -0,0 +1,150 @@
+# ================================================================
+# 10. Pipeline Cache
+# Re-use the output of unchanged pipeline stages between runs
+# ================================================================
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+
+import pandas as pd
+
+from .data_loading_and_exploration import load_data
+from .data_cleaning_and_preprocessing import clean_data
+from .data_feature_engineering import engineer_features
+from .location_clustering import add_random_coordinates, cluster_with_saved_model
+
+# ----------------------------------------------------------------
+# Cache keys: input fingerprint + stage name + parameters + code version
+# ----------------------------------------------------------------
+def file_fingerprint(path, block_size=1 << 20):
+    """
+    Hash of the file contents, so a touched but unchanged file still hits
+    the cache.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def code_version(func):
+    """
+    Hash of the source of the module defining func: editing a stage (or
+    a helper next to it) invalidates that stage and everything after it.
+    """
+    source = inspect.getsource(sys.modules[func.__module__])
+    return hashlib.blake2b(source.encode(), digest_size=16).hexdigest()
+
+def stage_key(upstream_key, name, func, params):
+    payload = json.dumps([upstream_key, name, code_version(func), params],
+                         sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+# ----------------------------------------------------------------
+# Size-bounded LRU eviction
+# ----------------------------------------------------------------
+def evict_cache(cache_dir, max_bytes, keep=()):
+    """
+    Deletes the least recently used cache files until the cache fits in
+    max_bytes. Files listed in keep are never deleted.
+    """
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith('.parquet'):
+            path = os.path.join(cache_dir, name)
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if path in keep:
+            continue
+        os.remove(path)
+        total -= size
+
+# ----------------------------------------------------------------
+# Full pipeline with every stage cached
+# ----------------------------------------------------------------
+PIPELINE_STAGES = [
+    ('load', load_data),
+    ('clean', clean_data),
+    ('features', engineer_features),
+    ('coordinates', add_random_coordinates),
+    ('clustering', cluster_with_saved_model),
+]
+
+def _stage_files(path, cache_dir, params, model_path):
+    """
+    Cache file of every stage. The clustering key also holds the saved
+    model's fingerprint: a new or refitted model invalidates it.
+    """
+    model = file_fingerprint(model_path) if os.path.exists(model_path) else None
+    key, files = file_fingerprint(path), []
+    for name, func in PIPELINE_STAGES:
+        stage_params = {**params.get(name, {}), **({'model': model} if name == 'clustering' else {})}
+        key = stage_key(key, name, func, stage_params)
+        files.append(os.path.join(cache_dir, f'{name}-{key}.parquet'))
+    return files
+
+def run_cached_pipeline(path='data/Uber Request Data.csv', cache_dir='output/.cache',
+                        max_cache_bytes=2 * 1024 ** 3, n_clusters=5, seed=42,
+                        model_path='output/cluster_model.pkl'):
+    """
+    Runs load -> clean -> engineer -> coordinates -> clustering and stores
+    each stage's output as Parquet in cache_dir. Stage keys only depend on
+    the input fingerprint, parameters, code and the saved clustering model,
+    so they are all computed up front: the pipeline resumes from the last
+    stage already cached and only that one file is read.
+
+    Clustering uses the saved model, like main() (see
+    cluster_with_saved_model).
+
+    Parameters:
+    - path: raw request file
+    - cache_dir: folder holding the cached stage outputs
+    - max_cache_bytes: cache size limit (least recently used files go first)
+    - n_clusters: number of KMeans clusters
+    - seed: seed for the simulated coordinates
+    - model_path: saved clustering model (fitted and saved if missing)
+
+    Returns:
+    - the clustered, feature-engineered DataFrame
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    params = {
+        'load': {'path': path},
+        'coordinates': {'seed': seed},
+        'clustering': {'model_path': model_path, 'n_clusters': n_clusters},
+    }
+    files = _stage_files(path, cache_dir, params, model_path)
+
+    # Resume after the last stage whose output is already cached
+    cached = [i for i, f in enumerate(files) if os.path.exists(f)]
+    first = cached[-1] + 1 if cached else 0
+    df = None
+    if cached:
+        os.utime(files[cached[-1]])  # mark as recently used
+        df = pd.read_parquet(files[cached[-1]])
+        print(f"♻️ Loaded '{PIPELINE_STAGES[cached[-1]][0]}' stage from cache")
+
+    for (name, func), cache_file in zip(PIPELINE_STAGES[first:], files[first:]):
+        stage_params = params.get(name, {})
+        df = func(**stage_params) if df is None else func(df, **stage_params)
+        df.reset_index(drop=True).to_parquet(cache_file, index=False)
+        print(f"⚙️ Computed and cached '{name}' stage")
+
+    # A first fit (or refit) saved a new model: file the clustered output
+    # under the key of the model it was labelled with
+    if first < len(files):
+        latest = _stage_files(path, cache_dir, params, model_path)
+        if latest[-1] != files[-1]:
+            os.replace(files[-1], latest[-1])
+            files = latest
+
+    evict_cache(cache_dir, max_cache_bytes, keep=files)
+    return df
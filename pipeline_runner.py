@@ -0,0 +1,252 @@
+# ================================================================
+# 12. Instrumented Pipeline Runner
+# Runs every stage with timing, memory and row-count instrumentation
+# ================================================================
+
+import argparse
+import contextlib
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+import pandas as pd
+
+from .data_loading_and_exploration import load_data
+from .data_cleaning_and_preprocessing import clean_data
+from .data_feature_engineering import engineer_features
+from .location_clustering import add_random_coordinates, cluster_with_saved_model
+from .save_transformed_data import save_data
+from .summary_cube import build_request_cube
+from .driver_stats import build_driver_stats
+from .plot_rendering import PLOTS, plot_input, render_plot
+
+# ----------------------------------------------------------------
+# Sampling profiler producing folded stacks ("a;b;c 42" per line),
+# the input format of flamegraph.pl and speedscope
+# ----------------------------------------------------------------
+class StackSampler:
+    """
+    Samples the call stack of the calling thread every `interval` seconds
+    from a background thread.
+    """
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.stacks = Counter()
+        self._target = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def folded(self):
+        return '\n'.join(f'{stack} {count}' for stack, count in self.stacks.most_common())
+
+# ----------------------------------------------------------------
+# Resident memory of one stage: ru_maxrss is the peak of the whole
+# process, so the current RSS is polled while the stage runs instead
+# ----------------------------------------------------------------
+def _rss_mb():
+    """
+    Current resident set size in MB (from /proc), or None where /proc is
+    not available.
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1e6
+    except (OSError, AttributeError, ValueError):
+        return None
+
+class RssSampler:
+    """
+    Polls the process RSS every `interval` seconds from a background
+    thread; peak_growth_mb() is the highest RSS seen minus the RSS at the
+    start (None if RSS cannot be read on this platform).
+    """
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.start = self.peak = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _sample(self):
+        rss = _rss_mb()
+        if rss is not None:
+            self.peak = max(self.peak, rss)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        self.start = self.peak = _rss_mb()
+        if self.start is not None:
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        if self.start is not None:
+            self._stop.set()
+            self._thread.join()
+            self._sample()
+
+    def peak_growth_mb(self):
+        return None if self.start is None else self.peak - self.start
+
+# ----------------------------------------------------------------
+# Run one stage with instrumentation
+# ----------------------------------------------------------------
+def run_stage(name, func, *args, profile=False, trace_memory=False, sample_stacks=False, **kwargs):
+    """
+    Calls func(*args, **kwargs) and measures wall time, CPU time, the peak
+    RSS growth during the stage, rows in/out and, optionally, the
+    tracemalloc peak, a cProfile summary and sampled call stacks.
+
+    Returns:
+    - (output of func, record dict, folded stacks or None)
+    """
+    first = args[0] if args else None
+    record = {'stage': name, 'rows_in': len(first) if isinstance(first, pd.DataFrame) else None}
+
+    profiler = cProfile.Profile() if profile else None
+    sampler = StackSampler() if sample_stacks else None
+    rss = RssSampler()
+    if trace_memory:
+        tracemalloc.start()
+
+    wall, cpu = time.perf_counter(), time.process_time()
+    with contextlib.ExitStack() as running:
+        running.enter_context(rss)
+        if sampler:
+            running.enter_context(sampler)
+        if profiler:
+            profiler.enable()
+            running.callback(profiler.disable)
+        out = func(*args, **kwargs)
+    record['wall_seconds'] = time.perf_counter() - wall
+    record['cpu_seconds'] = time.process_time() - cpu
+
+    if trace_memory:
+        record['traced_peak_mb'] = tracemalloc.get_traced_memory()[1] / 1e6
+        tracemalloc.stop()
+    record['peak_rss_growth_mb'] = rss.peak_growth_mb()
+    record['rows_out'] = len(out) if isinstance(out, pd.DataFrame) else None
+
+    if profiler:
+        text = io.StringIO()
+        pstats.Stats(profiler, stream=text).sort_stats('cumulative').print_stats(15)
+        record['profile'] = text.getvalue()
+
+    return out, record, sampler.folded() if sampler else None
+
+# ----------------------------------------------------------------
+# Full pipeline with a structured run report
+# ----------------------------------------------------------------
+def run_instrumented_pipeline(path='data/Uber Request Data.csv',
+                              output_path='output/Uber with features.csv',
+                              plot_dir='output/plots', n_clusters=5, profile=False,
+                              trace_memory=False, report_path=None, flamegraph_path=None,
+                              model_path='output/cluster_model.pkl'):
+    """
+    Runs load -> clean -> engineer -> coordinates -> clustering -> save ->
+    every plot (rendered to plot_dir), instrumenting each stage. Clustering
+    uses the saved model, as in main().
+
+    Parameters:
+    - path, output_path, plot_dir, n_clusters: as in main()
+    - model_path: saved clustering model (see cluster_with_saved_model)
+    - profile: attach a cProfile summary (top 15 by cumulative time) per stage
+    - trace_memory: record the tracemalloc peak per stage (slows stages down)
+    - report_path: write the run report as JSON
+    - flamegraph_path: write the sampled folded stacks of the slowest stage
+
+    Returns:
+    - report dict: one record per stage, total wall time and slowest stage
+    """
+    options = {'profile': profile, 'trace_memory': trace_memory,
+               'sample_stacks': flamegraph_path is not None}
+    records, stacks = [], {}
+
+    def stage(name, func, *args, **kwargs):
+        out, record, folded = run_stage(name, func, *args, **options, **kwargs)
+        records.append(record)
+        stacks[name] = folded
+        print(f"⏱️ {name}: {record['wall_seconds']:.3f}s wall, {record['cpu_seconds']:.3f}s CPU, "
+              f"rows {record['rows_in']} -> {record['rows_out']}")
+        return out
+
+    start = time.perf_counter()
+    df = stage('load_data', load_data, path)
+    df = stage('clean_data', clean_data, df)
+    df = stage('engineer_features', engineer_features, df)
+    df = stage('add_random_coordinates', add_random_coordinates, df)
+    df = stage('cluster_with_saved_model', cluster_with_saved_model, df, model_path, n_clusters=n_clusters)
+    stage('save_data', save_data, df, output_path)
+
+    os.makedirs(plot_dir, exist_ok=True)
+    cube = stage('build_request_cube', build_request_cube, df)
+    drivers = stage('build_driver_stats', build_driver_stats, df)
+    for name in PLOTS:
+        stage(f'plot:{name}', render_plot, plot_input(name, df, cube, drivers), name, plot_dir)
+
+    slowest = max(records, key=lambda r: r['wall_seconds'])['stage']
+    report = {
+        'input': path,
+        'total_seconds': time.perf_counter() - start,
+        'slowest_stage': slowest,
+        'stages': records,
+    }
+
+    if report_path:
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"📝 Run report written to {report_path}")
+    if flamegraph_path:
+        with open(flamegraph_path, 'w') as f:
+            f.write(stacks[slowest])
+        print(f"🔥 Folded stacks of '{slowest}' written to {flamegraph_path}")
+    return report
+
+# ----------------------------------------------------------------
+# Command line: python -m src.pipeline_runner --report run.json
+# ----------------------------------------------------------------
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser(description='Run the pipeline with per-stage instrumentation')
+    cli.add_argument('--input', default='data/Uber Request Data.csv')
+    cli.add_argument('--output', default='output/Uber with features.csv')
+    cli.add_argument('--plot-dir', default='output/plots')
+    cli.add_argument('--model-path', default='output/cluster_model.pkl')
+    cli.add_argument('--profile', action='store_true', help='cProfile summary per stage')
+    cli.add_argument('--trace-memory', action='store_true', help='tracemalloc peak per stage')
+    cli.add_argument('--report', help='write the run report (JSON) here')
+    cli.add_argument('--flamegraph', help='write folded stacks of the slowest stage here')
+    args = cli.parse_args()
+
+    run_instrumented_pipeline(args.input, args.output, args.plot_dir, profile=args.profile,
+                              trace_memory=args.trace_memory, report_path=args.report,
+                              flamegraph_path=args.flamegraph, model_path=args.model_path)
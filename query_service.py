@@ -0,0 +1,207 @@
+# ================================================================
+# 17. Query Service
+# Cached aggregate queries over the engineered data (Python + HTTP)
+# ================================================================
+
+import argparse
+import copy
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+from .data_loading_and_exploration import load_data
+from .incremental_ingestion import load_feature_store
+
+# Columns read from the store (those missing from the source are skipped)
+QUERY_COLUMNS = ['Request Date', 'Pickup point', 'Status', 'Request hour', 'Request day',
+                 'Time slot', 'Is Completed', 'Trip Duration Mins', 'cluster']
+
+# Filter name -> column; each filter accepts one value or a list
+QUERY_FILTERS = {
+    'pickup_point': 'Pickup point',
+    'status': 'Status',
+    'hour': 'Request hour',
+    'cluster': 'cluster',
+}
+GROUP_BY_COLUMNS = ['Request Date', 'Pickup point', 'Status', 'Request hour', 'Request day',
+                    'Time slot', 'cluster']
+
+# ----------------------------------------------------------------
+# In-process query API
+# ----------------------------------------------------------------
+class QueryService:
+    """
+    Answers aggregate queries over the engineered requests, filtered on
+    date range, pickup point, status, hour and cluster.
+
+    The data is loaded once; results are kept in an LRU cache keyed on the
+    normalized query, so repeated dashboard queries are answered without
+    touching the data. query() returns a copy of the cached result and is
+    safe to call from several threads.
+
+    Parameters:
+    - source: feature store folder (see incremental_ingestion) or a saved
+      feature table (.parquet/.feather/.csv, e.g. with the 'cluster' column)
+    - cache_size: number of query results kept in the LRU cache
+    """
+
+    def __init__(self, source='output/feature_store', cache_size=1024):
+        if os.path.isdir(source):
+            df = load_feature_store(source)
+        else:
+            df = load_data(source) if source.endswith(('.parquet', '.feather')) else pd.read_csv(source)
+        df = df[[c for c in QUERY_COLUMNS if c in df.columns]]
+        self.df = df.assign(**{'Request Date': pd.to_datetime(df['Request Date'])})
+        self._dates = self.df['Request Date'].to_numpy(dtype='datetime64[D]')
+        self._cached_query = lru_cache(maxsize=cache_size)(self._run_query)
+
+    def query(self, start=None, end=None, group_by=None, **filters):
+        """
+        Aggregates the requests matching every filter.
+
+        Parameters:
+        - start, end: Request Date bounds, inclusive ('YYYY-MM-DD')
+        - pickup_point, status, hour, cluster: one value or a list of values
+        - group_by: optional column (see GROUP_BY_COLUMNS) to also count by
+
+        Returns:
+        - dict with requests, completed, cancelled, no_cars, completion_rate,
+          avg_duration_mins (of the completed trips) and, with group_by, the
+          request count per group
+        """
+        unknown = set(filters) - set(QUERY_FILTERS)
+        if unknown:
+            raise ValueError(f"Unknown filters {sorted(unknown)}; use {sorted(QUERY_FILTERS)}")
+        if group_by is not None and group_by not in GROUP_BY_COLUMNS:
+            raise ValueError(f"group_by must be one of {GROUP_BY_COLUMNS}")
+        if group_by is not None and group_by not in self.df.columns:
+            raise ValueError(f"The source has no {group_by!r} column to group by")
+        for name, values in filters.items():
+            if values is not None and QUERY_FILTERS[name] not in self.df.columns:
+                raise ValueError(f"The source has no {QUERY_FILTERS[name]!r} column")
+
+        # Normalized, hashable cache key: filters in a fixed order, values sorted
+        key = tuple(
+            (name, tuple(sorted({str(v) for v in np.atleast_1d(filters[name])})))
+            for name in sorted(filters) if filters[name] is not None
+        )
+        # Callers get their own copy: mutating it must not change the cache
+        return copy.deepcopy(self._cached_query(start, end, group_by, key))
+
+    def cache_info(self):
+        return self._cached_query.cache_info()._asdict()
+
+    def _run_query(self, start, end, group_by, key):
+        mask = np.ones(len(self.df), dtype=bool)
+        if start is not None:
+            mask &= self._dates >= np.datetime64(start, 'D')
+        if end is not None:
+            mask &= self._dates <= np.datetime64(end, 'D')
+        for name, values in key:
+            column = self.df[QUERY_FILTERS[name]]
+            if pd.api.types.is_numeric_dtype(column):
+                values = [float(v) for v in values]
+            mask &= column.isin(values).to_numpy()
+
+        rows = self.df[mask]
+        status = rows['Status']
+        requests, completed = len(rows), int(rows['Is Completed'].sum())
+        result = {
+            'requests': requests,
+            'completed': completed,
+            'cancelled': int((status == 'Cancelled').sum()),
+            'no_cars': int((status == 'No Cars Available').sum()),
+            'completion_rate': float(rows['Is Completed'].mean()) if requests else None,
+            'avg_duration_mins': (float(rows.loc[rows['Is Completed'], 'Trip Duration Mins'].mean())
+                                  if completed else None),
+        }
+        if group_by is not None:
+            counts = rows.groupby(group_by, observed=True).size()
+            if group_by == 'Request Date':
+                counts.index = counts.index.strftime('%Y-%m-%d')
+            result['groups'] = {str(k): int(v) for k, v in counts.items()}
+        return result
+
+# ----------------------------------------------------------------
+# HTTP front end: GET /query?start=...&pickup_point=Airport&hour=8&hour=9
+# ----------------------------------------------------------------
+class _QueryHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+        if url.path == '/query':
+            single = {name: params.pop(name)[-1] for name in ('start', 'end', 'group_by') if name in params}
+            try:
+                self._send(200, self.server.service.query(**single, **params))
+            except ValueError as error:
+                self._send(400, {'error': str(error)})
+        elif url.path == '/stats':
+            self._send(200, self.server.service.cache_info())
+        else:
+            self._send(404, {'error': f'unknown path {url.path}'})
+
+    def _send(self, code, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # one line per request would dominate the output under load
+
+class QueryServer(HTTPServer):
+    """
+    HTTP server handing each connection to a fixed-size thread pool.
+    """
+
+    request_queue_size = 128  # listen backlog; the default of 5 drops bursts
+
+    def __init__(self, service, host='127.0.0.1', port=8765, n_threads=8):
+        super().__init__((host, port), _QueryHandler)
+        self.service = service
+        self.pool = ThreadPoolExecutor(max_workers=n_threads)
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self._handle, request, client_address)
+
+    def _handle(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(wait=True)
+
+# ----------------------------------------------------------------
+# Command line: python -m src.query_service --source output/feature_store
+# ----------------------------------------------------------------
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser(description='Serve aggregate queries over the engineered data')
+    cli.add_argument('--source', default='output/feature_store', help='feature store folder or feature file')
+    cli.add_argument('--host', default='127.0.0.1')
+    cli.add_argument('--port', type=int, default=8765)
+    cli.add_argument('--threads', type=int, default=8)
+    cli.add_argument('--cache-size', type=int, default=1024)
+    args = cli.parse_args()
+
+    server = QueryServer(QueryService(args.source, args.cache_size), args.host, args.port, args.threads)
+    print(f"🔎 Serving queries on http://{args.host}:{server.server_port}/query")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -2,9 +2,57 @@
 # 6. Save the cleaned and feature-engineered dataset
 # ================================================================
 
-def save_data(df, path='output/Uber with features.csv'):
+import os
+
+from .data_feature_engineering import with_trip_duration_text
+
+# ----------------------------------------------------------------
+# Supported output formats (picked from the file extension)
+# ----------------------------------------------------------------
+COLUMNAR_EXTENSIONS = {
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.feather': 'feather',
+}
+
+def get_file_format(path):
+    """
+    Returns 'parquet', 'feather' or 'csv' based on the file extension.
+    """
+    ext = os.path.splitext(str(path))[1].lower()
+    return COLUMNAR_EXTENSIONS.get(ext, 'csv')
+
+# ----------------------------------------------------------------
+# Save the DataFrame (CSV, Parquet or Feather)
+# ----------------------------------------------------------------
+def save_data(df, path='output/Uber with features.csv', append=False):
+    """
+    Writes the DataFrame to CSV, or to Parquet/Feather when the path ends in
+    .parquet/.pq/.feather. The columnar formats keep the column types
+    (datetime64, Int64, category, bool) so they do not need re-parsing.
+
+    CSV output always includes the 'Trip duration' text column; compact
+    frames derive it here from the timestamps.
+
+    With append=True the rows are added to an existing CSV file without
+    repeating the header (used by chunked runs). Columnar files are always
+    written in one go.
+    """
+    file_format = get_file_format(path)
+    if append and file_format != 'csv':
+        raise ValueError(f"append is only supported for CSV output, not {file_format}")
+
     print("💾 Saving transformed data to", path)
-    df.to_csv(path, index=False)
+
+    if file_format == 'parquet':
+        df.to_parquet(path, index=False)
+    elif file_format == 'feather':
+        # Feather only stores a default RangeIndex
+        df.reset_index(drop=True).to_feather(path)
+    else:
+        if {'Request timestamp', 'Drop timestamp'} <= set(df.columns):
+            df = with_trip_duration_text(df)
+        df.to_csv(path, index=False, mode='a' if append else 'w', header=not append)
 
 # Optional test
 if __name__ == "__main__":
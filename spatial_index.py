@@ -0,0 +1,129 @@
+# ================================================================
+# 14. Spatial Index over the Pickup Coordinates
+# Radius, nearest-neighbour and bounding-box queries without full scans
+# ================================================================
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+# Points are (Longitude, Latitude) pairs, the same plane the clustering
+# works in; distances and radii are in coordinate units.
+COORDINATE_COLUMNS = ['Longitude', 'Latitude']
+
+def _as_points(points):
+    """
+    Turns one (lon, lat) pair or an (n, 2) array-like into an (n, 2)
+    float64 array.
+    """
+    points = np.atleast_2d(np.asarray(points, dtype='float64'))
+    if points.ndim != 2 or points.shape[1] != 2:
+        raise ValueError(f"points must have shape (n, 2) as (Longitude, Latitude), got {points.shape}")
+    return points
+
+# ----------------------------------------------------------------
+# Index over every request (and optionally the cluster centroids)
+# ----------------------------------------------------------------
+class SpatialIndex:
+    """
+    KD-tree over the request coordinates of a clustered DataFrame.
+
+    Queries take batches of points and return row positions, to be used
+    with df.iloc. When the frame went through perform_clustering or
+    cluster_with_saved_model, the centroids from df.attrs['clustering']
+    are indexed too so new pickups can be assigned to existing clusters.
+
+    Parameters:
+    - df: DataFrame with 'Latitude' and 'Longitude'
+    - centers: optional centroids as (Longitude, Latitude) pairs
+      (default: taken from df.attrs['clustering'] when present)
+    - leafsize: KD-tree leaf size
+    - workers: threads used by the tree queries (-1 = all cores)
+    """
+
+    def __init__(self, df, centers=None, leafsize=32, workers=-1):
+        self.points = df[COORDINATE_COLUMNS].to_numpy(dtype='float64')
+        self.workers = workers
+        self.tree = cKDTree(self.points, leafsize=leafsize)
+
+        # Longitude-sorted view for bounding boxes: binary search on
+        # longitude, then a latitude mask over the slice
+        self._by_lon = np.argsort(self.points[:, 0], kind='stable')
+        self._sorted_lon = self.points[self._by_lon, 0]
+
+        if centers is None:
+            centers = df.attrs.get('clustering', {}).get('centers')
+        self.centers = None if centers is None else _as_points(centers)
+        self._center_tree = None if centers is None else cKDTree(self.centers)
+
+    def __len__(self):
+        return len(self.points)
+
+    def within_radius(self, points, radius, count_only=False):
+        """
+        Rows within radius of each query point.
+
+        Returns:
+        - list with one array of row positions per query point, or an
+          array of counts with count_only=True
+        """
+        found = self.tree.query_ball_point(_as_points(points), radius, workers=self.workers,
+                                           return_sorted=True, return_length=count_only)
+        return found if count_only else [np.asarray(rows, dtype=np.intp) for rows in found]
+
+    def nearest(self, points, k=1):
+        """
+        The k rows closest to each query point.
+
+        Returns:
+        - distances and row positions, both of shape (n_points, k)
+        """
+        distances, rows = self.tree.query(_as_points(points), k=[*range(1, k + 1)],
+                                          workers=self.workers)
+        return distances, rows
+
+    def within_bbox(self, boxes):
+        """
+        Rows inside each (min_lon, min_lat, max_lon, max_lat) box, bounds
+        included.
+
+        Returns:
+        - list with one sorted array of row positions per box
+        """
+        boxes = np.atleast_2d(np.asarray(boxes, dtype='float64'))
+        if boxes.shape[1] != 4:
+            raise ValueError("boxes must be (min_lon, min_lat, max_lon, max_lat)")
+        lo = np.searchsorted(self._sorted_lon, boxes[:, 0], side='left')
+        hi = np.searchsorted(self._sorted_lon, boxes[:, 2], side='right')
+
+        results = []
+        for (_, min_lat, _, max_lat), start, stop in zip(boxes, lo, hi):
+            rows = self._by_lon[start:stop]
+            lat = self.points[rows, 1]
+            results.append(np.sort(rows[(lat >= min_lat) & (lat <= max_lat)]))
+        return results
+
+    def assign(self, points):
+        """
+        Assigns incoming points to their nearest existing centroid.
+
+        Returns:
+        - cluster labels (int32) and distances to the centroid
+        """
+        if self._center_tree is None:
+            raise ValueError("No centroids indexed: cluster the frame first or pass centers")
+        distances, labels = self._center_tree.query(_as_points(points), workers=self.workers)
+        return labels.astype(np.int32), distances
+
+# ----------------------------------------------------------------
+# Optional: Run this module directly for testing
+# ----------------------------------------------------------------
+if __name__ == "__main__":
+    import pandas as pd
+    from .location_clustering import add_random_coordinates, perform_clustering
+
+    df = perform_clustering(add_random_coordinates(pd.DataFrame({'Request id': range(10_000)})))
+    index = SpatialIndex(df)
+    print(index.within_radius([[0, 0], [5, 5]], radius=1, count_only=True))
+    print(index.nearest([0, 0], k=3))
+    print(len(index.within_bbox([-1, -1, 1, 1])[0]))
+    print(index.assign([[0, 0], [15, -8]]))
@@ -0,0 +1,79 @@
+# ================================================================
+# 9. Summary Cube
+# Request counts pre-aggregated over every plotting dimension
+# ================================================================
+
+import pandas as pd
+
+# ----------------------------------------------------------------
+# Dimensions kept in the cube (one row per combination present)
+# ----------------------------------------------------------------
+CUBE_DIMENSIONS = [
+    'Request hour',
+    'Request day',
+    'Time slot',
+    'Status',
+    'Pickup point',
+    'Driver Available',
+]
+
+# ----------------------------------------------------------------
+# Build the cube in a single groupby pass over the raw rows
+# ----------------------------------------------------------------
+def build_request_cube(df):
+    """
+    Counts requests per combination of CUBE_DIMENSIONS in one groupby.
+    The result has at most a few thousand rows whatever the size of df,
+    and every count plot can be drawn from it.
+
+    Parameters:
+    - df: feature-engineered DataFrame
+
+    Returns:
+    - DataFrame with the dimension columns and a 'Count' column
+    """
+    cube = (
+        df.groupby(CUBE_DIMENSIONS, observed=True, dropna=False)
+        .size()
+        .reset_index(name='Count')
+    )
+    cube.attrs['request_cube'] = True
+    return cube
+
+def is_request_cube(df):
+    """
+    True if df was produced by build_request_cube / merge_cubes.
+    """
+    return bool(df.attrs.get('request_cube', False))
+
+# ----------------------------------------------------------------
+# Combine cubes (e.g. one per chunk or per day) by adding their counts
+# ----------------------------------------------------------------
+def merge_cubes(*cubes):
+    """
+    Adds several cubes together into one cube.
+    """
+    merged = (
+        pd.concat(cubes, ignore_index=True)
+        .groupby(CUBE_DIMENSIONS, observed=True, dropna=False)['Count']
+        .sum()
+        .reset_index()
+    )
+    merged.attrs['request_cube'] = True
+    return merged
+
+# ----------------------------------------------------------------
+# Roll the cube up to the dimensions a plot needs
+# ----------------------------------------------------------------
+def cube_counts(df, by):
+    """
+    Request counts grouped by the column(s) in `by`. Accepts the cube or
+    rows, which only need the `by` columns (e.g. a cleaned frame for
+    'Status' or a lazy_query result).
+
+    Returns:
+    - Series 'Count' indexed by `by`
+    """
+    if is_request_cube(df):
+        return df.groupby(by, observed=True)['Count'].sum()
+    return df.groupby(by, observed=True).size().rename('Count')